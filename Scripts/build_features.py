@@ -1,133 +1,280 @@
+import argparse
+import sys
 import pandas as pd
 import numpy as np
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Scripts.storage import (
+    append_dataset,
+    dataset_columns,
+    dataset_path,
+    read_dataset,
+    write_dataset,
+)
+
 # Paths
 RAW_DIR = Path("data/raw")
 PROCESSED_DIR = Path("data/processed")
-PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
-
-# Load data
-products = pd.read_csv(RAW_DIR / "products.csv")
-prices = pd.read_csv(RAW_DIR / "daily_prices.csv", parse_dates=["date"])
-sales = pd.read_csv(RAW_DIR / "daily_sales.csv", parse_dates=["date"])
-inventory = pd.read_csv(RAW_DIR / "inventory_snapshot.csv", parse_dates=["date"])
-promos = pd.read_csv(RAW_DIR / "promotions.csv", parse_dates=["start_date", "end_date"])
-calendar = pd.read_csv(RAW_DIR / "calendar.csv", parse_dates=["date"])
-
-# Base frame (SKU x Day)
-df = (
-    prices
-    .merge(sales, on=["date", "product_id"], how="left")
-    .merge(inventory, on=["date", "product_id"], how="left")
-    .merge(products, on="product_id", how="left")
-    .merge(calendar, on="date", how="left")
-    .sort_values(["product_id", "date"])
-)
 
-df["units_sold"] = df["units_sold"].fillna(0)
+# Longest lookback used by any feature (sales_lag_14, 14-day rolls)
+STATE_DAYS = 14
+
+STATE_COLS = ["date", "product_id", "price", "units_sold", "on_hand_qty"]
+
+
+def load_raw(filters=None):
+    """
+    Load raw inputs. filters (e.g. [("date", "==", day)]) restricts
+    the SKU x Day tables; Parquet storage skips other partitions.
+    """
+    products = read_dataset(RAW_DIR, "products")
+    prices = read_dataset(RAW_DIR, "daily_prices", filters=filters)
+    sales = read_dataset(RAW_DIR, "daily_sales", filters=filters)
+    inventory = read_dataset(RAW_DIR, "inventory_snapshot", filters=filters)
+    promos = read_dataset(RAW_DIR, "promotions")
+    calendar = read_dataset(RAW_DIR, "calendar")
+
+    return products, prices, sales, inventory, promos, calendar
 
-# Promotion features (known ahead of time)
-df["is_on_promo"] = 0
-df["promo_discount_pct"] = 0.0
 
-for _, promo in promos.iterrows():
-    mask = (
-        (df["product_id"] == promo["product_id"]) &
-        (df["date"] >= promo["start_date"]) &
-        (df["date"] <= promo["end_date"])
+def build_daily_frame(prices, sales, inventory):
+    """
+    Raw SKU x Day facts the features are derived from.
+    """
+    return (
+        prices
+        .merge(sales, on=["date", "product_id"], how="left")
+        .merge(inventory, on=["date", "product_id"], how="left")
     )
-    df.loc[mask, "is_on_promo"] = 1
-    df.loc[mask, "promo_discount_pct"] = promo["discount_pct"]
 
-# Lag Features (Demand)
-for lag in [1, 7, 14]:
-    df[f"sales_lag_{lag}"] = (
-        df.groupby("product_id")["units_sold"].shift(lag).fillna(0)
+
+def build_feature_frame(daily, products, promos, calendar):
+    """
+    Compute model features from raw SKU x Day facts.
+    """
+
+    # Base frame (SKU x Day)
+    df = (
+        daily
+        .merge(products, on="product_id", how="left")
+        .merge(calendar, on="date", how="left")
+        .sort_values(["product_id", "date"])
     )
 
-# Rolling Demand Stats (closed windows)
-df["sales_roll_mean_7"] = (
-    df.groupby("product_id")["units_sold"]
-    .shift(1)
-    .rolling(7, min_periods=1)
-    .mean()
-    .fillna(0)
-)
+    df["units_sold"] = df["units_sold"].fillna(0)
 
-df["sales_roll_mean_14"] = (
-    df.groupby("product_id")["units_sold"]
-    .shift(1)
-    .rolling(14, min_periods=1)
-    .mean()
-    .fillna(0)
-)
+    # Promotion features (known ahead of time)
+    # Expand each promo to one row per covered day and join on
+    # (product_id, date). Where promotions overlap, the one listed
+    # last in promotions.csv wins.
+    promo_days = (
+        (promos["end_date"] - promos["start_date"]).dt.days + 1
+    ).clip(lower=0)
 
-df["sales_roll_std_7"] = (
-    df.groupby("product_id")["units_sold"]
-    .shift(1)
-    .rolling(7, min_periods=1)
-    .std()
-    .fillna(0)
-)
+    promo_rows = promos.loc[
+        promos.index.repeat(promo_days),
+        ["product_id", "start_date", "discount_pct"]
+    ]
+    promo_rows["date"] = promo_rows["start_date"] + pd.to_timedelta(
+        promo_rows.groupby(level=0).cumcount(), unit="D"
+    )
+    promo_rows = promo_rows.drop_duplicates(["product_id", "date"], keep="last")
 
-# Price Context Features
-df["price_lag_1"] = df.groupby("product_id")["price"].shift(1)
-df["price_lag_7"] = df.groupby("product_id")["price"].shift(7)
+    promo_discount = (
+        df[["product_id", "date"]]
+        .merge(
+            promo_rows[["product_id", "date", "discount_pct"]],
+            on=["product_id", "date"],
+            how="left"
+        )["discount_pct"]
+        .to_numpy()
+    )
 
-df["price_roll_mean_14"] = (
-    df.groupby("product_id")["price"]
-    .shift(1)
-    .rolling(14, min_periods=1)
-    .mean()
-)
+    df["is_on_promo"] = (~np.isnan(promo_discount)).astype(int)
+    df["promo_discount_pct"] = np.nan_to_num(promo_discount, nan=0.0)
 
-df["rel_price"] = (
-    df["price_lag_1"] / df["price_roll_mean_14"]
-).replace([np.inf, -np.inf], 1.0).fillna(1.0)
+    # Lag Features (Demand)
+    for lag in [1, 7, 14]:
+        df[f"sales_lag_{lag}"] = (
+            df.groupby("product_id")["units_sold"].shift(lag).fillna(0)
+        )
 
-df["price_change_1d"] = (
-    (df["price_lag_1"] - df["price_lag_7"]) / df["price_lag_7"]
-).replace([np.inf, -np.inf], 0.0).fillna(0.0)
+    # Rolling Demand Stats (closed windows, per SKU)
+    prior_sales = (
+        df.groupby("product_id")["units_sold"]
+        .shift(1)
+        .groupby(df["product_id"])
+    )
 
-# Inventory Features
-df["inventory_lag_1"] = df.groupby("product_id")["on_hand_qty"].shift(1)
+    df["sales_roll_mean_7"] = (
+        prior_sales
+        .rolling(7, min_periods=1)
+        .mean()
+        .droplevel(0)
+        .fillna(0)
+    )
 
-df["days_of_stock"] = np.where(
-    df["sales_roll_mean_7"] > 0,
-    df["inventory_lag_1"] / df["sales_roll_mean_7"],
-    999.0
-)
+    df["sales_roll_mean_14"] = (
+        prior_sales
+        .rolling(14, min_periods=1)
+        .mean()
+        .droplevel(0)
+        .fillna(0)
+    )
+
+    df["sales_roll_std_7"] = (
+        prior_sales
+        .rolling(7, min_periods=1)
+        .std()
+        .droplevel(0)
+        .fillna(0)
+    )
+
+    # Price Context Features
+    df["price_lag_1"] = df.groupby("product_id")["price"].shift(1)
+    df["price_lag_7"] = df.groupby("product_id")["price"].shift(7)
+
+    df["price_roll_mean_14"] = (
+        df.groupby("product_id")["price"]
+        .shift(1)
+        .groupby(df["product_id"])
+        .rolling(14, min_periods=1)
+        .mean()
+        .droplevel(0)
+    )
+
+    df["rel_price"] = (
+        df["price_lag_1"] / df["price_roll_mean_14"]
+    ).replace([np.inf, -np.inf], 1.0).fillna(1.0)
+
+    df["price_change_1d"] = (
+        (df["price_lag_1"] - df["price_lag_7"]) / df["price_lag_7"]
+    ).replace([np.inf, -np.inf], 0.0).fillna(0.0)
+
+    # Inventory Features
+    df["inventory_lag_1"] = df.groupby("product_id")["on_hand_qty"].shift(1)
+
+    df["days_of_stock"] = np.where(
+        df["sales_roll_mean_7"] > 0,
+        df["inventory_lag_1"] / df["sales_roll_mean_7"],
+        999.0
+    )
+
+    df["inventory_pressure"] = df["days_of_stock"] / df["clearance_days"]
+
+    # Calendar Encodings
+    df["week_of_year_sin"] = np.sin(2 * np.pi * df["week_of_year"] / 52)
+    df["week_of_year_cos"] = np.cos(2 * np.pi * df["week_of_year"] / 52)
+
+    season_dummies = pd.get_dummies(df["season"], prefix="season")
+    df = pd.concat([df, season_dummies], axis=1)
+
+    # Control Columns (for optimizer)
+    df["prev_price"] = df["price_lag_1"]
+    df["prev_inventory"] = df["inventory_lag_1"]
+
+    # Final Cleanup
+    drop_cols = [
+        "price",          # current-day price (leakage)
+        "units_sold",     # current-day sales (leakage)
+        "on_hand_qty",    # current-day inventory (leakage)
+        "season"
+    ]
+
+    df = df.drop(columns=drop_cols)
+
+    df = df.dropna(subset=["prev_price", "prev_inventory"])
+
+    df = df.sort_values(["product_id", "date"])
+
+    return df
+
+
+def trailing_state(daily):
+    """
+    Last STATE_DAYS days of raw facts per SKU, enough to compute
+    every lag and rolling feature for the next day.
+    """
+    daily = daily.sort_values(["product_id", "date"])
+
+    return daily.groupby("product_id").tail(STATE_DAYS)[STATE_COLS]
+
+
+def build_full():
+    products, prices, sales, inventory, promos, calendar = load_raw()
 
-df["inventory_pressure"] = df["days_of_stock"] / df["clearance_days"]
+    daily = build_daily_frame(prices, sales, inventory)
+    df = build_feature_frame(daily, products, promos, calendar)
 
-# Calendar Encodings
-df["week_of_year_sin"] = np.sin(2 * np.pi * df["week_of_year"] / 52)
-df["week_of_year_cos"] = np.cos(2 * np.pi * df["week_of_year"] / 52)
+    # Save
+    write_dataset(df, PROCESSED_DIR, "model_features")
+    write_dataset(trailing_state(daily), PROCESSED_DIR, "feature_state")
 
-season_dummies = pd.get_dummies(df["season"], prefix="season")
-df = pd.concat([df, season_dummies], axis=1)
+    output_path = dataset_path(PROCESSED_DIR, "model_features")
+    print(f"Feature table written to {output_path.resolve()}")
 
-# Control Columns (for optimizer)
-df["prev_price"] = df["price_lag_1"]
-df["prev_inventory"] = df["inventory_lag_1"]
 
-# Final Cleanup
-drop_cols = [
-    "price",          # current-day price (leakage)
-    "units_sold",     # current-day sales (leakage)
-    "on_hand_qty",    # current-day inventory (leakage)
-    "season"
-]
+def build_incremental(run_date):
+    """
+    Compute features for a single new date and append them to the
+    feature table, using the persisted trailing state instead of
+    recomputing the whole history.
+    """
 
-df = df.drop(columns=drop_cols)
+    run_date = pd.Timestamp(run_date)
 
-df = df.dropna(subset=["prev_price", "prev_inventory"])
+    state = read_dataset(PROCESSED_DIR, "feature_state")
 
-df = df.sort_values(["product_id", "date"])
+    last_date = state["date"].max()
+
+    if last_date >= run_date:
+        print(f"Features already built through {last_date.date()}")
+        return
+
+    # Lags are row-based, so days must be appended in order
+    if run_date - last_date > pd.Timedelta(days=1):
+        print(f"Build {(last_date + pd.Timedelta(days=1)).date()} first")
+        return
+
+    products, prices, sales, inventory, promos, calendar = load_raw(
+        filters=[("date", "==", run_date)]
+    )
+
+    new_daily = build_daily_frame(prices, sales, inventory)
+
+    if new_daily.empty:
+        print(f"No raw data found for {run_date.date()}")
+        return
+
+    daily = pd.concat([state, new_daily[STATE_COLS]], ignore_index=True)
+
+    df = build_feature_frame(daily, products, promos, calendar)
+    df = df[df["date"] == run_date]
+
+    # Keep the stored column layout (e.g. season dummies absent today)
+    header = dataset_columns(PROCESSED_DIR, "model_features")
+    df = df.reindex(columns=header, fill_value=False)
+
+    append_dataset(df, PROCESSED_DIR, "model_features")
+    write_dataset(trailing_state(daily), PROCESSED_DIR, "feature_state")
+
+    print(f"Appended {len(df)} feature rows for {run_date.date()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build model features")
+    parser.add_argument(
+        "--date",
+        help="Build only this date (YYYY-MM-DD) incrementally",
+    )
+    args = parser.parse_args()
 
-# Save
-output_path = PROCESSED_DIR / "model_features.csv"
-df.to_csv(output_path, index=False)
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
-print(f"Feature table written to {output_path.resolve()}")
+    if args.date:
+        build_incremental(args.date)
+    else:
+        build_full()
@@ -1,16 +1,20 @@
+import argparse
+import sys
 import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime, timedelta
 
-np.random.seed(42)
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Scripts.storage import append_dataset, write_dataset
 
 N_SKUS = 200
 N_DAYS = 180
 START_DATE = datetime(2025, 7, 1)
 
 DATA_DIR = Path("data/raw")
-DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 CATEGORIES = {
     "grocery": {"base_demand": 20, "elasticity": -1.5},
@@ -19,114 +23,274 @@ CATEGORIES = {
     "stationery": {"base_demand": 8, "elasticity": -1.0},
 }
 
-products = []
-for i in range(N_SKUS):
-    category = np.random.choice(list(CATEGORIES.keys()))
-    cost_price = np.round(np.random.uniform(20, 300), 2)
 
-    products.append({
-        "product_id": f"SKU_{i:05d}",
-        "category": category,
-        "cost_price": cost_price,
+def generate(n_skus=N_SKUS, n_days=N_DAYS, seed=42):
+    """
+    Reference generator: one Python iteration per SKU-day.
+    Reproduces the bundled dataset with the default arguments.
+    """
+    np.random.seed(seed)
+
+    products = []
+    for i in range(n_skus):
+        category = np.random.choice(list(CATEGORIES.keys()))
+        cost_price = np.round(np.random.uniform(20, 300), 2)
+
+        products.append({
+            "product_id": f"SKU_{i:05d}",
+            "category": category,
+            "cost_price": cost_price,
+            "min_margin_pct": 0.15,
+            "clearance_days": np.random.choice([30, 45, 60])
+        })
+
+    products_df = pd.DataFrame(products)
+
+    calendar = []
+    for d in range(n_days):
+        date = START_DATE + timedelta(days=d)
+        calendar.append({
+            "date": date.date(),
+            "day_of_week": date.weekday(),
+            "week_of_year": date.isocalendar()[1],
+            "is_holiday": int(np.random.rand() < 0.05),
+            "season": "winter" if date.month in [11, 12, 1] else "summer"
+        })
+
+    calendar_df = pd.DataFrame(calendar)
+
+    promos = []
+    for _, row in products_df.iterrows():
+        if np.random.rand() < 0.15:
+            start = START_DATE + timedelta(days=np.random.randint(0, n_days - 14))
+            promos.append({
+                "product_id": row["product_id"],
+                "start_date": start.date(),
+                "end_date": (start + timedelta(days=14)).date(),
+                "discount_pct": np.random.choice([0.10, 0.15, 0.20])
+            })
+
+    promos_df = pd.DataFrame(promos)
+
+    prices = []
+    sales = []
+    inventory = []
+
+    for _, prod in products_df.iterrows():
+        sku = prod["product_id"]
+        category = prod["category"]
+        base_demand = CATEGORIES[category]["base_demand"]
+        elasticity = CATEGORIES[category]["elasticity"]
+
+        cost = prod["cost_price"]
+        price = cost * np.random.uniform(1.2, 1.6)
+        stock = np.random.randint(200, 500)
+
+        for d in range(n_days):
+            date = START_DATE + timedelta(days=d)
+
+            # Promotion check
+            promo = promos_df[
+                (promos_df.product_id == sku) &
+                (promos_df.start_date <= date.date()) &
+                (promos_df.end_date >= date.date())
+            ]
+            discount = promo.discount_pct.values[0] if not promo.empty else 0.0
+
+            effective_price = price * (1 - discount)
+
+            # Demand generation
+            noise = np.random.normal(0, 1)
+            demand = base_demand * (effective_price / price) ** elasticity
+            demand = max(0, demand + noise)
+            units_sold = int(min(stock, round(demand)))
+
+            # Log records
+            prices.append({
+                "date": date.date(),
+                "product_id": sku,
+                "price": round(effective_price, 2)
+            })
+
+            sales.append({
+                "date": date.date(),
+                "product_id": sku,
+                "units_sold": units_sold
+            })
+
+            inventory.append({
+                "date": date.date(),
+                "product_id": sku,
+                "on_hand_qty": stock
+            })
+
+            # Inventory update
+            stock -= units_sold
+
+            # Weekly restock
+            if d % 7 == 0:
+                stock += np.random.randint(50, 150)
+
+            # Price drift
+            price *= np.random.uniform(0.98, 1.02)
+
+    write_dataset(products_df, DATA_DIR, "products")
+    write_dataset(calendar_df, DATA_DIR, "calendar")
+    write_dataset(promos_df, DATA_DIR, "promotions")
+    write_dataset(pd.DataFrame(prices), DATA_DIR, "daily_prices")
+    write_dataset(pd.DataFrame(sales), DATA_DIR, "daily_sales")
+    write_dataset(pd.DataFrame(inventory), DATA_DIR, "inventory_snapshot")
+
+
+def _flush_daily_tables(buffers, first_chunk):
+    for name, frames in buffers.items():
+        chunk = pd.concat(frames, ignore_index=True)
+
+        if first_chunk:
+            write_dataset(chunk, DATA_DIR, name)
+        else:
+            append_dataset(chunk, DATA_DIR, name)
+
+        frames.clear()
+
+
+def generate_vectorized(n_skus=N_SKUS, n_days=N_DAYS, seed=42, chunk_days=7):
+    """
+    Vectorized generator for large (load-test) datasets.
+
+    Same data model as generate(), but all SKUs are simulated at
+    once: the inventory/restock recurrence steps day by day over
+    NumPy arrays, and SKU x Day tables are flushed to storage every
+    chunk_days days. Output depends only on n_skus, n_days and seed
+    (it is not bit-identical to generate()).
+    """
+    rng = np.random.default_rng(seed)
+
+    names = list(CATEGORIES)
+    category_idx = rng.integers(0, len(names), n_skus)
+
+    base_demand = np.array(
+        [CATEGORIES[c]["base_demand"] for c in names], dtype=float
+    )[category_idx]
+    elasticity = np.array(
+        [CATEGORIES[c]["elasticity"] for c in names], dtype=float
+    )[category_idx]
+
+    # Products
+    product_ids = np.array([f"SKU_{i:05d}" for i in range(n_skus)])
+    cost = np.round(rng.uniform(20, 300, n_skus), 2)
+
+    products_df = pd.DataFrame({
+        "product_id": product_ids,
+        "category": np.array(names)[category_idx],
+        "cost_price": cost,
         "min_margin_pct": 0.15,
-        "clearance_days": np.random.choice([30, 45, 60])
+        "clearance_days": rng.choice([30, 45, 60], n_skus),
     })
 
-products_df = pd.DataFrame(products)
-
-calendar = []
-for d in range(N_DAYS):
-    date = START_DATE + timedelta(days=d)
-    calendar.append({
-        "date": date.date(),
-        "day_of_week": date.weekday(),
-        "week_of_year": date.isocalendar()[1],
-        "is_holiday": int(np.random.rand() < 0.05),
-        "season": "winter" if date.month in [11, 12, 1] else "summer"
+    # Calendar
+    dates = pd.date_range(START_DATE, periods=n_days, freq="D")
+
+    calendar_df = pd.DataFrame({
+        "date": dates,
+        "day_of_week": dates.weekday,
+        "week_of_year": dates.isocalendar().week.to_numpy(dtype=int),
+        "is_holiday": (rng.random(n_days) < 0.05).astype(int),
+        "season": np.where(dates.month.isin([11, 12, 1]), "winter", "summer"),
     })
 
-calendar_df = pd.DataFrame(calendar)
-
-promos = []
-for _, row in products_df.iterrows():
-    if np.random.rand() < 0.15:
-        start = START_DATE + timedelta(days=np.random.randint(0, N_DAYS - 14))
-        promos.append({
-            "product_id": row["product_id"],
-            "start_date": start.date(),
-            "end_date": (start + timedelta(days=14)).date(),
-            "discount_pct": np.random.choice([0.10, 0.15, 0.20])
-        })
+    # Promotions (at most one 14-day promo per SKU)
+    has_promo = rng.random(n_skus) < 0.15
+    promo_start = rng.integers(0, n_days - 14, n_skus)
+    promo_discount = rng.choice([0.10, 0.15, 0.20], n_skus)
 
-promos_df = pd.DataFrame(promos)
+    promos_df = pd.DataFrame({
+        "product_id": product_ids[has_promo],
+        "start_date": dates[promo_start[has_promo]],
+        "end_date": dates[promo_start[has_promo] + 14],
+        "discount_pct": promo_discount[has_promo],
+    })
 
-prices = []
-sales = []
-inventory = []
+    write_dataset(products_df, DATA_DIR, "products")
+    write_dataset(calendar_df, DATA_DIR, "calendar")
+    write_dataset(promos_df, DATA_DIR, "promotions")
 
-for _, prod in products_df.iterrows():
-    sku = prod["product_id"]
-    category = prod["category"]
-    base_demand = CATEGORIES[category]["base_demand"]
-    elasticity = CATEGORIES[category]["elasticity"]
+    # Daily simulation, all SKUs per step
+    price = cost * rng.uniform(1.2, 1.6, n_skus)
+    stock = rng.integers(200, 500, n_skus)
 
-    cost = prod["cost_price"]
-    price = cost * np.random.uniform(1.2, 1.6)
-    stock = np.random.randint(200, 500)
+    buffers = {"daily_prices": [], "daily_sales": [], "inventory_snapshot": []}
+    first_chunk = True
 
-    for d in range(N_DAYS):
-        date = START_DATE + timedelta(days=d)
-
-        # Promotion check
-        promo = promos_df[
-            (promos_df.product_id == sku) &
-            (promos_df.start_date <= date.date()) &
-            (promos_df.end_date >= date.date())
-        ]
-        discount = promo.discount_pct.values[0] if not promo.empty else 0.0
+    for d in range(n_days):
+        on_promo = has_promo & (promo_start <= d) & (d <= promo_start + 14)
+        discount = np.where(on_promo, promo_discount, 0.0)
 
         effective_price = price * (1 - discount)
 
         # Demand generation
-        noise = np.random.normal(0, 1)
+        noise = rng.normal(0, 1, n_skus)
         demand = base_demand * (effective_price / price) ** elasticity
-        demand = max(0, demand + noise)
-        units_sold = int(min(stock, round(demand)))
+        demand = np.maximum(0, demand + noise)
+        units_sold = np.minimum(stock, np.rint(demand)).astype(np.int64)
 
         # Log records
-        prices.append({
-            "date": date.date(),
-            "product_id": sku,
-            "price": round(effective_price, 2)
-        })
-
-        sales.append({
-            "date": date.date(),
-            "product_id": sku,
-            "units_sold": units_sold
-        })
-
-        inventory.append({
-            "date": date.date(),
-            "product_id": sku,
-            "on_hand_qty": stock
-        })
+        buffers["daily_prices"].append(pd.DataFrame({
+            "date": dates[d],
+            "product_id": product_ids,
+            "price": np.round(effective_price, 2),
+        }))
+        buffers["daily_sales"].append(pd.DataFrame({
+            "date": dates[d],
+            "product_id": product_ids,
+            "units_sold": units_sold,
+        }))
+        buffers["inventory_snapshot"].append(pd.DataFrame({
+            "date": dates[d],
+            "product_id": product_ids,
+            "on_hand_qty": stock.copy(),
+        }))
 
         # Inventory update
         stock -= units_sold
 
         # Weekly restock
         if d % 7 == 0:
-            stock += np.random.randint(50, 150)
+            stock += rng.integers(50, 150, n_skus)
 
         # Price drift
-        price *= np.random.uniform(0.98, 1.02)
+        price *= rng.uniform(0.98, 1.02, n_skus)
+
+        if (d + 1) % chunk_days == 0 or d == n_days - 1:
+            _flush_daily_tables(buffers, first_chunk)
+            first_chunk = False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generate synthetic retail pricing data"
+    )
+    parser.add_argument("--n-skus", type=int, default=N_SKUS)
+    parser.add_argument("--n-days", type=int, default=N_DAYS)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--vectorized",
+        action="store_true",
+        help="Use the vectorized, chunk-streaming generator",
+    )
+    parser.add_argument(
+        "--chunk-days",
+        type=int,
+        default=7,
+        help="Days per flushed chunk (vectorized mode)",
+    )
+    args = parser.parse_args()
+
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-products_df.to_csv(DATA_DIR / "products.csv", index=False)
-calendar_df.to_csv(DATA_DIR / "calendar.csv", index=False)
-promos_df.to_csv(DATA_DIR / "promotions.csv", index=False)
-pd.DataFrame(prices).to_csv(DATA_DIR / "daily_prices.csv", index=False)
-pd.DataFrame(sales).to_csv(DATA_DIR / "daily_sales.csv", index=False)
-pd.DataFrame(inventory).to_csv(DATA_DIR / "inventory_snapshot.csv", index=False)
+    if args.vectorized:
+        generate_vectorized(args.n_skus, args.n_days, args.seed, args.chunk_days)
+    else:
+        generate(args.n_skus, args.n_days, args.seed)
 
-print("Synthetic retail pricing data generated successfully.")
\ No newline at end of file
+    print("Synthetic retail pricing data generated successfully.")
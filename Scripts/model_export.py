@@ -0,0 +1,150 @@
+import argparse
+import json
+import math
+from datetime import datetime, timezone
+from pathlib import Path
+
+import joblib
+import numpy as np
+import xgboost as xgb
+
+MODEL_STEM = "demand_xgb"
+
+# Preferred first; the pickle is only read for models trained before
+# native export existed
+NATIVE_FORMATS = (".ubj", ".json")
+LEGACY_FORMAT = ".pkl"
+
+METADATA_SUFFIX = ".meta.json"
+
+
+# -----------------------------
+# Export
+# -----------------------------
+def _json_safe(value):
+    """
+    value with NumPy scalars unwrapped and non-finite floats (e.g.
+    XGBoost's missing=NaN) as None, so the sidecar is strict JSON.
+    """
+
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+
+    return value
+
+
+def save_native_model(model, directory, feature_cols, metadata=None, fmt=".ubj"):
+    """
+    Save an XGBoost model in XGBoost's own format (UBJ or JSON) with
+    a JSON sidecar holding the feature order and training metadata.
+
+    Unlike a pickle, the native file loads without unpickling Python
+    objects and across Python / XGBoost versions.
+    """
+
+    if fmt not in NATIVE_FORMATS:
+        raise ValueError(f"fmt must be one of {NATIVE_FORMATS}")
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    booster = model.get_booster() if hasattr(model, "get_booster") else model
+
+    model_path = directory / f"{MODEL_STEM}{fmt}"
+    booster.save_model(model_path)
+
+    sidecar = {
+        "model_file": model_path.name,
+        "feature_cols": list(feature_cols),
+        "xgboost_version": xgb.__version__,
+        "exported_at": datetime.now(timezone.utc).isoformat(),
+        **(metadata or {}),
+    }
+
+    metadata_path = directory / f"{MODEL_STEM}{METADATA_SUFFIX}"
+    metadata_path.write_text(
+        json.dumps(_json_safe(sidecar), indent=2, default=str, allow_nan=False)
+    )
+
+    return model_path, metadata_path
+
+
+def find_model_file(directory):
+    """
+    Model file in directory, native formats first; None if absent.
+    """
+
+    directory = Path(directory)
+
+    for fmt in (*NATIVE_FORMATS, LEGACY_FORMAT):
+        path = directory / f"{MODEL_STEM}{fmt}"
+        if path.exists():
+            return path
+
+    return None
+
+
+def load_metadata(directory):
+    path = Path(directory) / f"{MODEL_STEM}{METADATA_SUFFIX}"
+
+    if not path.exists():
+        return {}
+
+    return json.loads(path.read_text())
+
+
+# -----------------------------
+# Load
+# -----------------------------
+def load_booster(path):
+    """
+    Booster for a model file; pickles are unwrapped to their booster.
+    """
+
+    path = Path(path)
+
+    if path.suffix == LEGACY_FORMAT:
+        model = joblib.load(path)
+        return model.get_booster() if hasattr(model, "get_booster") else model
+
+    booster = xgb.Booster()
+    booster.load_model(path)
+
+    return booster
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert a pickled demand model to XGBoost's native format"
+    )
+    parser.add_argument("directory", help="Directory holding demand_xgb.pkl")
+    parser.add_argument("--format", choices=NATIVE_FORMATS, default=".ubj")
+    args = parser.parse_args()
+
+    source = Path(args.directory) / f"{MODEL_STEM}{LEGACY_FORMAT}"
+    booster = load_booster(source)
+
+    if not booster.feature_names:
+        parser.error(
+            f"{source} has no feature names; re-export it from training "
+            f"with save_native_model(model, directory, feature_cols)"
+        )
+
+    model_path, metadata_path = save_native_model(
+        booster,
+        args.directory,
+        booster.feature_names,
+        metadata={"converted_from": source.name},
+        fmt=args.format,
+    )
+
+    print(f"Model written to {model_path} (metadata {metadata_path})")
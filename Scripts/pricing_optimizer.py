@@ -169,3 +169,213 @@ def select_optimal_price(
         "expected_revenue": best["expected_revenue"],
         "reason": "revenue_maximization",
     }
+
+# -----------------------------
+# Batch (columnar) optimizer
+# -----------------------------
+# SKUs scored per pass; larger batches are split into blocks
+BATCH_BLOCK_SIZE = 16384
+
+def _round2(values, python_round=True):
+    """
+    Round an array to 2 decimals exactly like Python's round().
+
+    round() rounds the exact binary value of a float, half to even;
+    np.round scales by 100 first and can land on the wrong side of
+    a .xx5 boundary. Entries near such a boundary are compared with
+    the exact midpoint instead, so batch output matches the scalar
+    path bit for bit. With python_round=False, plain np.round is
+    used instead.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+
+    if not python_round:
+        return np.round(values, 2)
+
+    scaled = values * 100
+    rounded = np.rint(scaled)
+
+    # Distance to the nearest integer; ties sit at ~0.5
+    scaled -= rounded
+    np.abs(scaled, out=scaled)
+    near_tie = scaled > 0.5 - 1e-6
+
+    if near_tie.any():
+        x = values[near_tie]
+        lower = np.floor(np.abs(x) * 100)
+
+        # |x| * 200 = p + err exactly: |x| * 8 is exact, and Dekker's
+        # split makes both partial products by 25 exact too
+        y = np.abs(x) * 8
+        split = 134217729.0 * y
+        hi = split - (split - y)
+        p = y * 25
+        err = (hi * 25 - p) + (y - hi) * 25
+
+        # Sign of |x| * 200 - (2 * lower + 1), i.e. of |x| minus the
+        # midpoint between lower and lower + 1 hundredths
+        above = (p - (2 * lower + 1)) + err
+
+        lower += (above > 0) | ((above == 0) & (lower % 2 == 1))
+        rounded[near_tie] = np.copysign(lower, x)
+
+    rounded /= 100
+
+    return rounded
+
+
+def _category_elasticities(category):
+    """
+    Map an array of category labels to elasticities.
+    """
+
+    category = np.asarray(category)
+    elasticity = np.full(category.shape[0], -1.0)
+
+    for name, value in CATEGORY_ELASTICITY.items():
+        elasticity[category == name] = value
+
+    return elasticity
+
+
+def _select_optimal_prices_block(
+    prev_price,
+    cost_price,
+    base_demand,
+    category,
+    inventory_lag_1,
+    sales_roll_mean_7,
+    days_to_expiry,
+    python_round
+):
+    """
+    select_optimal_prices_batch for one block of SKUs.
+    """
+
+    # Matrices are candidate-major (K x SKUs) so every operation
+    # broadcasts over contiguous SKU rows.
+    prev = prev_price[None, :]
+
+    # --- Candidate generation ---
+    multipliers = np.asarray(CANDIDATE_MULTIPLIERS, dtype=np.float64)
+    raw = multipliers[:, None] * prev
+    min_price = cost_price * (1 + MIN_MARGIN_PCT)
+
+    in_bounds = (raw >= min_price) & (
+        np.abs(raw - prev) / prev <= MAX_DAILY_PRICE_CHANGE_PCT
+    )
+
+    # Fallback row: previous price, only used if nothing else passes
+    fallback = ~in_bounds.any(axis=0)
+
+    candidates = _round2(np.vstack([raw, prev]), python_round)
+    generated = np.vstack([in_bounds, fallback[None, :]])
+
+    # --- Demand & revenue ---
+    elasticity = _category_elasticities(category)
+
+    units = base_demand * (candidates / prev) ** elasticity
+    units = np.maximum(np.minimum(units, inventory_lag_1), 0)
+
+    revenue = _round2(candidates * units, python_round)
+    units = _round2(units, python_round)
+
+    # --- Stock-out avoidance ---
+    min_safe_inventory = STOCKOUT_BUFFER_DAYS * sales_roll_mean_7
+    valid = generated & ~((inventory_lag_1 - units) < min_safe_inventory)
+
+    # --- Clearance pressure ---
+    with np.errstate(divide="ignore", invalid="ignore"):
+        days_of_stock = np.where(
+            sales_roll_mean_7 > 0,
+            inventory_lag_1 / sales_roll_mean_7,
+            np.inf,
+        )
+
+    clearance_risk = (
+        (days_to_expiry <= CLEARANCE_WARNING_DAYS)
+        & (days_of_stock > days_to_expiry)
+    )
+    valid &= ~(clearance_risk & (candidates > prev))
+
+    # --- Selection (first max wins, as in the scalar path) ---
+    scored = np.where(valid, revenue, -np.inf)
+    best = np.argmax(scored, axis=0)
+    has_valid = valid.any(axis=0)
+
+    cols = np.arange(prev_price.shape[0])
+
+    final_price = np.where(
+        has_valid, candidates[best, cols], _round2(prev_price, python_round)
+    )
+    expected_units_sold = np.where(has_valid, units[best, cols], np.nan)
+    expected_revenue = np.where(has_valid, revenue[best, cols], np.nan)
+    reason = np.where(has_valid, "revenue_maximization", "no_valid_candidate")
+
+    return {
+        "final_price": final_price,
+        "expected_units_sold": expected_units_sold,
+        "expected_revenue": expected_revenue,
+        "reason": reason,
+    }
+
+
+def select_optimal_prices_batch(
+    prev_price,
+    cost_price,
+    base_demand,
+    category,
+    inventory_lag_1,
+    sales_roll_mean_7,
+    days_to_expiry,
+    python_round=True
+):
+    """
+    Select optimal prices for many SKUs at once.
+
+    Takes one array per select_optimal_price argument (same length,
+    one entry per SKU) and scores the SKU x candidate-multiplier
+    matrix with array operations, BATCH_BLOCK_SIZE SKUs at a time.
+    Returns a dict of arrays:
+    final_price, expected_units_sold, expected_revenue and reason.
+    Expected values are NaN where reason is "no_valid_candidate".
+
+    Results are identical to calling select_optimal_price per SKU.
+    round() on NumPy scalars (e.g. values read from a pandas row)
+    behaves like np.round, not like round() on Python floats; pass
+    python_round=False to match the scalar path on such inputs.
+    """
+
+    prev_price = np.asarray(prev_price, dtype=np.float64)
+    cost_price = np.asarray(cost_price, dtype=np.float64)
+    base_demand = np.asarray(base_demand, dtype=np.float64)
+    inventory_lag_1 = np.asarray(inventory_lag_1, dtype=np.float64)
+    sales_roll_mean_7 = np.asarray(sales_roll_mean_7, dtype=np.float64)
+    days_to_expiry = np.asarray(days_to_expiry, dtype=np.float64)
+
+    n = prev_price.shape[0]
+    category = np.asarray(category)
+
+    # Blocks keep the K x SKUs temporaries cache-resident
+    results = [
+        _select_optimal_prices_block(
+            prev_price[start:start + BATCH_BLOCK_SIZE],
+            cost_price[start:start + BATCH_BLOCK_SIZE],
+            base_demand[start:start + BATCH_BLOCK_SIZE],
+            category[start:start + BATCH_BLOCK_SIZE],
+            inventory_lag_1[start:start + BATCH_BLOCK_SIZE],
+            sales_roll_mean_7[start:start + BATCH_BLOCK_SIZE],
+            days_to_expiry[start:start + BATCH_BLOCK_SIZE],
+            python_round,
+        )
+        for start in range(0, max(n, 1), BATCH_BLOCK_SIZE)
+    ]
+
+    if len(results) == 1:
+        return results[0]
+
+    return {
+        key: np.concatenate([result[key] for result in results])
+        for key in results[0]
+    }
@@ -8,34 +8,15 @@ else:
 
 sys.path.insert(0, str(PROJECT_ROOT))
 
-import pandas as pd
 import matplotlib.pyplot as plt
 
-from Scripts.simulation.data_loader import load_simulation_data
-from Scripts.simulation.simulator import run_simulation
-from Scripts.simulation.strategies import (
-    static_pricing_strategy,
-    rule_based_pricing_strategy,
-    ml_pricing_strategy,
-)
+from Scripts.simulation.evaluation import load_strategy_results
 
 OUTPUT_DIR = Path("evaluation_outputs/category_breakdown")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-df = load_simulation_data()
-
-static_results = run_simulation(df, static_pricing_strategy)
-rule_results = run_simulation(df, rule_based_pricing_strategy)
-ml_results = run_simulation(df, ml_pricing_strategy)
-
-all_results = pd.concat(
-    [static_results, rule_results, ml_results],
-    ignore_index=True
-)
-
-# Attach category info
-category_map = df[["product_id", "category"]].drop_duplicates()
-all_results = all_results.merge(category_map, on="product_id", how="left")
+# Cached results already carry each SKU's category
+all_results = load_strategy_results()
 
 category_summary = (
     all_results
@@ -4,31 +4,15 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PROJECT_ROOT))
 
-import pandas as pd
 import matplotlib.pyplot as plt
 
-from Scripts.simulation.data_loader import load_simulation_data
-from Scripts.simulation.simulator import run_simulation
-from Scripts.simulation.strategies import (
-    static_pricing_strategy,
-    rule_based_pricing_strategy,
-    ml_pricing_strategy,
-)
+from Scripts.simulation.evaluation import load_strategy_results
 from Scripts.simulation.metrics import compute_strategy_metrics
 
 OUTPUT_DIR = Path("evaluation_outputs")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
-df = load_simulation_data()
-
-static_results = run_simulation(df, static_pricing_strategy)
-rule_results = run_simulation(df, rule_based_pricing_strategy)
-ml_results = run_simulation(df, ml_pricing_strategy)
-
-all_results = pd.concat(
-    [static_results, rule_results, ml_results],
-    ignore_index=True
-)
+all_results = load_strategy_results()
 
 summary = compute_strategy_metrics(all_results)
 summary.to_csv(OUTPUT_DIR / "strategy_summary.csv", index=False)
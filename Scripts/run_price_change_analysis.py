@@ -11,16 +11,9 @@ else:
 
 sys.path.insert(0, str(PROJECT_ROOT))
 
-import pandas as pd
 import matplotlib.pyplot as plt
 
-from Scripts.simulation.data_loader import load_simulation_data
-from Scripts.simulation.simulator import run_simulation
-from Scripts.simulation.strategies import (
-    static_pricing_strategy,
-    rule_based_pricing_strategy,
-    ml_pricing_strategy,
-)
+from Scripts.simulation.evaluation import load_strategy_results
 
 # -----------------------------
 # Output directory
@@ -29,21 +22,9 @@ OUTPUT_DIR = Path("evaluation_outputs")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 # -----------------------------
-# Load data
-# -----------------------------
-df = load_simulation_data()
-
-# -----------------------------
-# Run simulations
+# Load simulation results (cached)
 # -----------------------------
-static_results = run_simulation(df, static_pricing_strategy)
-rule_results = run_simulation(df, rule_based_pricing_strategy)
-ml_results = run_simulation(df, ml_pricing_strategy)
-
-all_results = pd.concat(
-    [static_results, rule_results, ml_results],
-    ignore_index=True
-)
+all_results = load_strategy_results()
 
 # -----------------------------
 # Compute daily price change %
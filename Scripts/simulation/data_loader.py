@@ -1,22 +1,39 @@
-import pandas as pd
 from pathlib import Path
 
+from Scripts.storage import dataset_path, read_dataset
+
 DATA_DIR = Path("data/processed")
 
-def load_simulation_data():
+SIMULATION_INPUTS = [
+    dataset_path(DATA_DIR, "model_features"),
+    dataset_path(DATA_DIR, "demand_predictions"),
+]
+
+def load_simulation_data(filters=None, columns=None):
     """
     Load model features and demand predictions
     required for offline pricing simulation.
+
+    filters / columns restrict the feature rows and columns read,
+    e.g. filters=[("date", "==", day)] or [("category", "==", c)].
     """
 
-    features = pd.read_csv(
-        DATA_DIR / "model_features.csv",
-        parse_dates=["date"]
+    if columns is not None:
+        columns = list(dict.fromkeys(["date", "product_id", *columns]))
+
+    features = read_dataset(
+        DATA_DIR,
+        "model_features",
+        columns=columns,
+        filters=filters
     )
 
-    predictions = pd.read_csv(
-        DATA_DIR / "demand_predictions.csv",
-        parse_dates=["date"]
+    date_filters = [f for f in filters or [] if f[0] == "date"]
+
+    predictions = read_dataset(
+        DATA_DIR,
+        "demand_predictions",
+        filters=date_filters
     )
 
     df = (
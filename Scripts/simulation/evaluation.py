@@ -0,0 +1,113 @@
+import hashlib
+import pandas as pd
+from pathlib import Path
+
+from Scripts.simulation.data_loader import (
+    SIMULATION_INPUTS,
+    load_simulation_data,
+)
+from Scripts.simulation.simulator import run_simulation
+from Scripts.simulation.strategies import STRATEGIES, STRATEGY_VERSION
+
+CACHE_DIR = Path("data/processed/simulation_cache")
+
+# -----------------------------
+# Cache Keys
+# -----------------------------
+def _file_digest(path):
+    digest = hashlib.sha256()
+    path = Path(path)
+
+    # Partitioned datasets are directories of files
+    files = sorted(path.rglob("*")) if path.is_dir() else [path]
+
+    for file in files:
+        if not file.is_file():
+            continue
+
+        digest.update(str(file.relative_to(path.parent)).encode())
+
+        with open(file, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+
+    return digest.hexdigest()
+
+
+def results_cache_key(strategy_names):
+    """
+    Key simulation results by input contents, strategy version
+    and the set of strategies simulated.
+    """
+
+    key = hashlib.sha256()
+
+    for path in SIMULATION_INPUTS:
+        key.update(f"{Path(path).name}:{_file_digest(path)}\n".encode())
+
+    key.update(f"version:{STRATEGY_VERSION}\n".encode())
+    key.update(f"strategies:{','.join(strategy_names)}\n".encode())
+
+    return key.hexdigest()[:16]
+
+
+def _cache_path(key):
+    # Parquet when an engine is installed, pickle otherwise
+    try:
+        import pyarrow  # noqa: F401
+        suffix = ".parquet"
+    except ImportError:
+        suffix = ".pkl"
+
+    return CACHE_DIR / f"results_{key}{suffix}"
+
+
+def _read_cache(path):
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def _write_cache(results, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if path.suffix == ".parquet":
+        results.to_parquet(path, index=False)
+    else:
+        results.to_pickle(path)
+
+
+# -----------------------------
+# Evaluation Engine
+# -----------------------------
+def load_strategy_results(strategy_names=None, refresh=False):
+    """
+    Simulate a set of strategies once and return combined results.
+
+    Results (one row per date, product_id and strategy, with the
+    SKU's category attached) are cached on disk and reused by every
+    report until the inputs or STRATEGY_VERSION change.
+    """
+
+    if strategy_names is None:
+        strategy_names = list(STRATEGIES)
+
+    cache_path = _cache_path(results_cache_key(strategy_names))
+
+    if not refresh and cache_path.exists():
+        return _read_cache(cache_path)
+
+    df = load_simulation_data()
+
+    all_results = pd.concat(
+        [run_simulation(df, STRATEGIES[name]) for name in strategy_names],
+        ignore_index=True
+    )
+
+    # Attach category info
+    category_map = df[["product_id", "category"]].drop_duplicates()
+    all_results = all_results.merge(category_map, on="product_id", how="left")
+
+    _write_cache(all_results, cache_path)
+
+    return all_results
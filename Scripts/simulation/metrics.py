@@ -1,5 +1,43 @@
+import numpy as np
 import pandas as pd
 
+# Days of stock reported when there is no recent demand to divide by
+# (same sentinel as the days_of_stock feature)
+DAYS_OF_STOCK_NO_DEMAND = 999.0
+
+
+# -----------------------------
+# SKU-day Outcomes
+# -----------------------------
+def inventory_outcomes(opening_inventory, units_sold, avg_daily_sales):
+    """
+    Per SKU-day inventory outcomes, vectorized over whole columns.
+
+    Shared by the offline simulation and the online inventory
+    monitoring job so both count stock-outs the same way: a SKU-day
+    is a stock-out when it sold through its opening inventory.
+    """
+
+    opening = np.asarray(opening_inventory, dtype=float)
+    sold = np.asarray(units_sold, dtype=float)
+    avg_sales = np.asarray(avg_daily_sales, dtype=float)
+
+    closing = opening - sold
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        days_of_stock = np.where(
+            avg_sales > 0,
+            closing / avg_sales,
+            DAYS_OF_STOCK_NO_DEMAND,
+        )
+
+    return {
+        "closing_inventory": closing,
+        "stockout": sold >= opening,
+        "days_of_stock": days_of_stock,
+    }
+
+
 # -----------------------------
 # Metrics Computation
 # -----------------------------
@@ -1,40 +1,66 @@
+import numpy as np
 import pandas as pd
 
+from Scripts.simulation.metrics import inventory_outcomes
+
 # -----------------------------
 # Core Simulation Engine
 # -----------------------------
+def _row_strategy_prices(df, pricing_strategy_fn):
+    """
+    Fallback for strategies without a vectorized form.
+    """
+
+    # iloc rows (not iterrows) so strategies see NumPy scalars,
+    # exactly as they did under the groupby engine
+    decisions = [pricing_strategy_fn(df.iloc[i]) for i in range(len(df))]
+
+    return {
+        "price": np.array([d["price"] for d in decisions], dtype=float),
+        "strategy": [d["strategy"] for d in decisions],
+    }
+
+
 def run_simulation(df, pricing_strategy_fn):
     """
     Run an offline pricing simulation for a given strategy.
-    """
 
-    df = df.sort_values(["date", "product_id"]).copy()
+    Operates on whole columns: the strategy's vectorized form is
+    used when it declares one, otherwise it is called per row.
+    Returns one result row per (date, product_id).
+    """
 
-    results = []
+    df = (
+        df.sort_values(["date", "product_id"], kind="stable")
+        .drop_duplicates(["date", "product_id"])
+        .reset_index(drop=True)
+    )
 
-    for (date, product_id), group in df.groupby(["date", "product_id"]):
-        row = group.iloc[0]
+    frame_fn = getattr(pricing_strategy_fn, "vectorized", None)
 
-        decision = pricing_strategy_fn(row)
-        price = decision["price"]
+    if frame_fn is not None:
+        decision = frame_fn(df)
+    else:
+        decision = _row_strategy_prices(df, pricing_strategy_fn)
 
-        # Realized demand (use predicted demand for offline eval)
-        demand = row["predicted_units_sold"]
-        inventory = row["prev_inventory"]
+    price = np.asarray(decision["price"], dtype=float)
 
-        units_sold = min(demand, inventory)
-        revenue = price * units_sold
+    # Realized demand (use predicted demand for offline eval)
+    demand = df["predicted_units_sold"].to_numpy(dtype=float)
+    inventory = df["prev_inventory"].to_numpy(dtype=float)
 
-        stockout = int(units_sold >= inventory)
+    units_sold = np.minimum(demand, inventory)
+    revenue = price * units_sold
 
-        results.append({
-            "date": date,
-            "product_id": product_id,
-            "strategy": decision["strategy"],
-            "price": price,
-            "units_sold": units_sold,
-            "revenue": revenue,
-            "stockout": stockout,
-        })
+    outcomes = inventory_outcomes(inventory, units_sold, demand)
+    stockout = outcomes["stockout"].astype(int)
 
-    return pd.DataFrame(results)
+    return pd.DataFrame({
+        "date": df["date"],
+        "product_id": df["product_id"],
+        "strategy": decision["strategy"],
+        "price": price,
+        "units_sold": units_sold,
+        "revenue": revenue,
+        "stockout": stockout,
+    })
@@ -1,8 +1,43 @@
-from Scripts.pricing_optimizer import select_optimal_price
+import numpy as np
+
+from Scripts.pricing_optimizer import (
+    select_optimal_price,
+    select_optimal_prices_batch,
+)
+
+# Bump whenever any strategy (or the optimizer it calls) changes
+# behaviour, so cached simulation results are recomputed.
+STRATEGY_VERSION = "1"
+
+
+def vectorized(frame_fn):
+    """
+    Attach a whole-frame form to a row strategy.
+
+    frame_fn(df) must return {"price": array, "strategy": name}
+    with one price per row of df, matching the row form exactly.
+    The simulator uses it when present and falls back to calling
+    the row form per row otherwise.
+    """
+
+    def decorate(row_fn):
+        row_fn.vectorized = frame_fn
+        return row_fn
+
+    return decorate
+
 
 # -----------------------------
 # Strategy 1: Static Pricing
 # -----------------------------
+def _static_pricing_frame(df):
+    return {
+        "price": np.round(df["prev_price"].to_numpy(dtype=float), 2),
+        "strategy": "static"
+    }
+
+
+@vectorized(_static_pricing_frame)
 def static_pricing_strategy(row):
     """
     Always keep previous day's price.
@@ -16,6 +51,31 @@ def static_pricing_strategy(row):
 # -----------------------------
 # Strategy 2: Rule-Based Pricing
 # -----------------------------
+def _rule_based_pricing_frame(df):
+    price = df["prev_price"].to_numpy(dtype=float)
+    inventory = df["prev_inventory"].to_numpy(dtype=float)
+    sales_roll_mean_7 = df["sales_roll_mean_7"].to_numpy(dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        days_of_stock = np.where(
+            sales_roll_mean_7 > 0,
+            inventory / sales_roll_mean_7,
+            np.inf,
+        )
+
+    price = np.where(
+        days_of_stock > 30,
+        price * 0.97,
+        np.where(days_of_stock < 5, price * 1.03, price),
+    )
+
+    return {
+        "price": np.round(price, 2),
+        "strategy": "rule_based"
+    }
+
+
+@vectorized(_rule_based_pricing_frame)
 def rule_based_pricing_strategy(row):
     """
     Simple heuristic pricing:
@@ -48,6 +108,26 @@ def rule_based_pricing_strategy(row):
 # -----------------------------
 # Strategy 3: ML-Driven Pricing
 # -----------------------------
+def _ml_pricing_frame(df):
+    # Row values are NumPy scalars, so the row form rounds like np.round
+    result = select_optimal_prices_batch(
+        prev_price=df["prev_price"].to_numpy(dtype=float),
+        cost_price=df["cost_price"].to_numpy(dtype=float),
+        base_demand=df["predicted_units_sold"].to_numpy(dtype=float),
+        category=df["category"].to_numpy(),
+        inventory_lag_1=df["prev_inventory"].to_numpy(dtype=float),
+        sales_roll_mean_7=df["sales_roll_mean_7"].to_numpy(dtype=float),
+        days_to_expiry=df["clearance_days"].to_numpy(dtype=float),
+        python_round=False,
+    )
+
+    return {
+        "price": result["final_price"],
+        "strategy": "ml"
+    }
+
+
+@vectorized(_ml_pricing_frame)
 def ml_pricing_strategy(row):
     """
     ML-driven pricing using demand forecasts
@@ -68,3 +148,11 @@ def ml_pricing_strategy(row):
         "price": result["final_price"],
         "strategy": "ml"
     }
+
+
+# Registry used by the evaluation engine (name -> strategy)
+STRATEGIES = {
+    "static": static_pricing_strategy,
+    "rule_based": rule_based_pricing_strategy,
+    "ml": ml_pricing_strategy,
+}
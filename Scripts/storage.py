@@ -0,0 +1,295 @@
+import os
+import shutil
+import pandas as pd
+from pathlib import Path
+
+# "csv" (default) or "parquet"
+DATA_FORMAT = os.getenv("DATA_FORMAT", "csv").lower()
+
+# -----------------------------
+# Typed Schemas
+# -----------------------------
+SCHEMAS = {
+    "products": {
+        "product_id": "str",
+        "category": "str",
+        "cost_price": "float64",
+        "min_margin_pct": "float64",
+        "clearance_days": "int64",
+    },
+    "calendar": {
+        "day_of_week": "int64",
+        "week_of_year": "int64",
+        "is_holiday": "int64",
+        "season": "str",
+    },
+    "promotions": {
+        "product_id": "str",
+        "discount_pct": "float64",
+    },
+    "daily_prices": {
+        "product_id": "str",
+        "price": "float64",
+    },
+    "daily_sales": {
+        "product_id": "str",
+        "units_sold": "int64",
+    },
+    "inventory_snapshot": {
+        "product_id": "str",
+        "on_hand_qty": "int64",
+    },
+    "demand_predictions": {
+        "product_id": "str",
+        "predicted_units_sold": "float64",
+    },
+}
+
+DATE_COLUMNS = {
+    "promotions": ["start_date", "end_date"],
+    "products": [],
+}
+
+# SKU x Day tables are stored as one Parquet partition per date
+PARTITIONED = {
+    "daily_prices",
+    "daily_sales",
+    "inventory_snapshot",
+    "model_features",
+    "demand_predictions",
+}
+
+
+def _date_columns(name):
+    return DATE_COLUMNS.get(name, ["date"])
+
+
+def dataset_path(directory, name):
+    """
+    File (CSV, unpartitioned Parquet) or directory (partitioned
+    Parquet) backing a dataset.
+    """
+    directory = Path(directory)
+
+    if DATA_FORMAT == "csv":
+        return directory / f"{name}.csv"
+    if name in PARTITIONED:
+        return directory / name
+    return directory / f"{name}.parquet"
+
+
+def _date_partitioning():
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return ds.partitioning(pa.schema([("date", pa.date32())]), flavor="hive")
+
+
+def _apply_schema(df, name):
+    schema = {
+        col: dtype
+        for col, dtype in SCHEMAS.get(name, {}).items()
+        if col in df.columns
+    }
+    df = df.astype(schema)
+
+    for col in _date_columns(name):
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col])
+
+    return df
+
+
+# -----------------------------
+# Writes
+# -----------------------------
+def _write_parquet(df, path, name, existing_data_behavior):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    if name in PARTITIONED:
+        table = table.set_column(
+            table.schema.get_field_index("date"),
+            "date",
+            table.column("date").cast(pa.date32()),
+        )
+        ds.write_dataset(
+            table,
+            path,
+            format="parquet",
+            partitioning=_date_partitioning(),
+            existing_data_behavior=existing_data_behavior,
+        )
+    else:
+        import pyarrow.parquet as pq
+        pq.write_table(table, path)
+
+
+def write_dataset(df, directory, name):
+    """
+    Replace a dataset with df.
+    """
+    path = dataset_path(directory, name)
+    df = _apply_schema(df, name)
+
+    if DATA_FORMAT == "csv":
+        df.to_csv(path, index=False)
+        return
+
+    if path.is_dir():
+        shutil.rmtree(path)
+
+    _write_parquet(df, path, name, "error")
+
+
+def append_dataset(df, directory, name):
+    """
+    Add rows to a dataset. For partitioned Parquet, the dates in df
+    replace any existing partitions for those dates.
+    """
+    path = dataset_path(directory, name)
+    df = _apply_schema(df, name)
+
+    if DATA_FORMAT == "csv":
+        df.to_csv(path, mode="a", header=False, index=False)
+        return
+
+    if name not in PARTITIONED:
+        df = pd.concat([read_dataset(directory, name), df], ignore_index=True)
+
+    _write_parquet(df, path, name, "delete_matching")
+
+
+# -----------------------------
+# Reads
+# -----------------------------
+_OPS = {
+    "==": lambda s, v: s == v,
+    "!=": lambda s, v: s != v,
+    "<": lambda s, v: s < v,
+    "<=": lambda s, v: s <= v,
+    ">": lambda s, v: s > v,
+    ">=": lambda s, v: s >= v,
+    "in": lambda s, v: s.isin(v),
+}
+
+
+def _normalize_filters(filters, name, as_date):
+    normalized = []
+
+    for col, op, value in filters:
+        if col in _date_columns(name):
+            convert = (
+                (lambda v: pd.Timestamp(v).date())
+                if as_date
+                else pd.Timestamp
+            )
+            value = (
+                [convert(v) for v in value]
+                if op == "in"
+                else convert(value)
+            )
+        normalized.append((col, op, value))
+
+    return normalized
+
+
+def read_dataset(directory, name, columns=None, filters=None):
+    """
+    Load a dataset, optionally restricted to some columns and rows.
+
+    filters is a list of (column, op, value) tuples ANDed together,
+    with op one of ==, !=, <, <=, >, >=, in. Parquet pushes both
+    the column list and the filters down to the reader (skipping
+    whole date partitions); CSV applies them after parsing.
+    """
+    path = dataset_path(directory, name)
+
+    if DATA_FORMAT == "csv":
+        df = pd.read_csv(
+            path,
+            usecols=columns,
+            dtype={
+                col: dtype
+                for col, dtype in SCHEMAS.get(name, {}).items()
+                if columns is None or col in columns
+            },
+            parse_dates=[
+                col for col in _date_columns(name)
+                if columns is None or col in columns
+            ],
+        )
+
+        for col, op, value in _normalize_filters(filters or [], name, False):
+            df = df[_OPS[op](df[col], value)]
+
+        return df.reset_index(drop=True)
+
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(
+        path,
+        columns=columns,
+        filters=_normalize_filters(filters, name, True) if filters else None,
+        partitioning=_date_partitioning() if name in PARTITIONED else "hive",
+    )
+
+    df = table.to_pandas()
+
+    # Partition keys come back last; keep date first as in the CSVs
+    if name in PARTITIONED and "date" in df.columns:
+        df = df[["date"] + [c for c in df.columns if c != "date"]]
+
+    return _apply_schema(df, name)
+
+
+def dataset_fingerprint(directory, name, start, end):
+    """
+    (file, size, mtime_ns) of every file holding the dataset's rows
+    for dates in [start, end], from stat() alone. It changes whenever
+    those rows are rewritten, without reading them.
+
+    Only partitioned Parquet can be narrowed to the window; CSV and
+    unpartitioned Parquet report their single backing file.
+    """
+    path = dataset_path(directory, name)
+
+    if DATA_FORMAT == "csv" or name not in PARTITIONED:
+        files = [path]
+    else:
+        # Hive partition directories, e.g. date=2025-07-01/
+        files = [
+            f
+            for day in pd.date_range(start, end)
+            for f in sorted((path / f"date={day.date()}").glob("*"))
+        ]
+
+    fingerprint = []
+    for f in files:
+        if f.is_file():
+            stat = f.stat()
+            fingerprint.append(
+                [str(f.relative_to(path.parent)), stat.st_size, stat.st_mtime_ns]
+            )
+
+    return fingerprint
+
+
+def dataset_columns(directory, name):
+    """
+    Column names of a stored dataset, without loading its rows.
+    """
+    path = dataset_path(directory, name)
+
+    if DATA_FORMAT == "csv":
+        return list(pd.read_csv(path, nrows=0).columns)
+
+    import pyarrow.dataset as ds
+
+    if name not in PARTITIONED:
+        return ds.dataset(path).schema.names
+
+    names = ds.dataset(path, partitioning=_date_partitioning()).schema.names
+    return ["date"] + [c for c in names if c != "date"]
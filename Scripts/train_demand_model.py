@@ -1,10 +1,19 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 from pathlib import Path
 import xgboost as xgb
 import numpy as np
 from sklearn.metrics import mean_absolute_error, mean_squared_error
-from pathlib import Path
-import joblib
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from Scripts.model_export import save_native_model
+from Scripts.storage import dataset_path, read_dataset, write_dataset
 
 MODEL_DIR = Path("models")
 MODEL_DIR.mkdir(exist_ok=True)
@@ -12,14 +21,12 @@ MODEL_DIR.mkdir(exist_ok=True)
 RAW_DIR = Path("data/raw")
 PROCESSED_DIR = Path("data/processed")
 
-features = pd.read_csv(
-    PROCESSED_DIR / "model_features.csv",
-    parse_dates=["date"]
-)
+features = read_dataset(PROCESSED_DIR, "model_features")
 
-sales = pd.read_csv(
-    RAW_DIR / "daily_sales.csv",
-    parse_dates=["date"]
+sales = read_dataset(
+    RAW_DIR,
+    "daily_sales",
+    columns=["date", "product_id", "units_sold"]
 )
 
 df = (
@@ -141,97 +148,147 @@ print(f"\nNumber of model features: {len(FEATURE_COLS)}")
 def wape(y_true, y_pred):
     return np.sum(np.abs(y_true - y_pred)) / np.sum(y_true)
 
-folds = [
-    (["train_1"], "val_1"),
-    (["train_1", "val_1"], "val_2"),
-    (["train_1", "val_1", "val_2"], "val_3"),
-]
+# -----------------------------
+# Shared training matrix
+# -----------------------------
+# df is sorted by date, so every walk-forward train / validation set
+# is a contiguous row range: slicing X gives views, not copies, and
+# all fold workers read the same float32 buffer.
+X = np.ascontiguousarray(df[FEATURE_COLS].to_numpy(dtype=np.float32))
+y = df["target_units_sold"].to_numpy(dtype=np.float32)
 
-metrics = []
+dates = df["date"].to_numpy()
 
-for i, (train_splits, val_split) in enumerate(folds, 1):
-    print(f"\n===== Fold {i}: {train_splits} → {val_split} =====")
+def rows_through(day):
+    """
+    Number of rows dated on or before day (end of a row range).
+    """
+    return int(np.searchsorted(dates, np.datetime64(day), side="right"))
 
-    train_df = df[df["split"].isin(train_splits)]
-    val_df   = df[df["split"] == val_split]
+train_1_rows = rows_through(train_1_end)
+val_1_rows = rows_through(val_1_end)
+val_2_rows = rows_through(val_2_end)
+val_3_rows = rows_through(val_3_end)
 
-    X_train = train_df[FEATURE_COLS]
-    y_train = train_df["target_units_sold"]
+folds = [
+    # (fold, train rows, validation rows)
+    (1, slice(0, train_1_rows), slice(train_1_rows, val_1_rows)),
+    (2, slice(0, val_1_rows), slice(val_1_rows, val_2_rows)),
+    (3, slice(0, val_2_rows), slice(val_2_rows, val_3_rows)),
+]
 
-    X_val = val_df[FEATURE_COLS]
-    y_val = val_df["target_units_sold"]
+XGB_PARAMS = {
+    "n_estimators": 300,
+    "max_depth": 6,
+    "learning_rate": 0.05,
+    "subsample": 0.8,
+    "colsample_bytree": 0.8,
+    "objective": "reg:squarederror",
+    "random_state": 42,
+}
 
-    model = xgb.XGBRegressor(
-        n_estimators=300,
-        max_depth=6,
-        learning_rate=0.05,
-        subsample=0.8,
-        colsample_bytree=0.8,
-        objective="reg:squarederror",
-        random_state=42,
-        n_jobs=-1
-    )
+# XGBoost releases the GIL while training, so folds run on threads
+# sharing X; each gets an equal slice of the cores.
+N_CPUS = os.cpu_count() or 1
+FOLD_THREADS = max(1, N_CPUS // len(folds))
 
-    model.fit(X_train, y_train)
+def run_fold(fold, train_rows, val_rows):
+    start = time.perf_counter()
 
-    preds = model.predict(X_val)
-    preds = np.clip(preds, 0, None)
+    model = xgb.XGBRegressor(**XGB_PARAMS, n_jobs=FOLD_THREADS)
+    model.fit(X[train_rows], y[train_rows])
 
-    fold_metrics = {
-        "fold": i,
+    y_val = y[val_rows].astype(np.float64)
+    preds = np.clip(model.predict(X[val_rows]), 0, None).astype(np.float64)
+
+    return {
+        "fold": fold,
         "MAE": mean_absolute_error(y_val, preds),
         "RMSE": np.sqrt(mean_squared_error(y_val, preds)),
-        "WAPE": wape(y_val.values, preds),
-        "Bias": np.mean(preds - y_val.values),
-        "Overforecast_Rate": np.mean(preds > y_val.values),
-        "Train_rows": len(train_df),
-        "Val_rows": len(val_df),
+        "WAPE": wape(y_val, preds),
+        "Bias": np.mean(preds - y_val),
+        "Overforecast_Rate": np.mean(preds > y_val),
+        "Train_rows": train_rows.stop - train_rows.start,
+        "Val_rows": val_rows.stop - val_rows.start,
+        "Threads": FOLD_THREADS,
+        "Fit_seconds": round(time.perf_counter() - start, 2),
     }
 
-    metrics.append(fold_metrics)
+print(
+    f"\n===== Walk-forward CV: {len(folds)} folds in parallel, "
+    f"{FOLD_THREADS} threads each ====="
+)
+
+cv_start = time.perf_counter()
+
+with ThreadPoolExecutor(max_workers=len(folds)) as pool:
+    metrics = list(pool.map(lambda f: run_fold(*f), folds))
+
+for fold_metrics in metrics:
     print(fold_metrics)
 
-final_train_df = df[df["split"] != "test"]
-test_df = df[df["split"] == "test"]
+print(f"CV wall time: {time.perf_counter() - cv_start:.1f}s")
 
-X_final_train = final_train_df[FEATURE_COLS]
-y_final_train = final_train_df["target_units_sold"]
+# Fold metrics as a table, next to the evaluation summaries
+CV_METRICS_PATH = Path("evaluation_outputs") / "cv_fold_metrics.csv"
+CV_METRICS_PATH.parent.mkdir(exist_ok=True)
+pd.DataFrame(metrics).to_csv(CV_METRICS_PATH, index=False)
 
-X_test = test_df[FEATURE_COLS]
-y_test = test_df["target_units_sold"]
+print(f"Fold metrics saved to {CV_METRICS_PATH.resolve()}")
 
-final_model = xgb.XGBRegressor(
-    n_estimators=300,
-    max_depth=6,
-    learning_rate=0.05,
-    subsample=0.8,
-    colsample_bytree=0.8,
-    objective="reg:squarederror",
-    random_state=42,
-    n_jobs=-1
-)
+final_train_rows = slice(0, val_3_rows)
+test_rows = slice(val_3_rows, len(df))
 
-final_model.fit(X_final_train, y_final_train)
+final_train_df = df.iloc[final_train_rows]
+test_df = df.iloc[test_rows]
+
+X_test = X[test_rows]
+y_test = df["target_units_sold"].to_numpy()[test_rows]
+
+final_model = xgb.XGBRegressor(**XGB_PARAMS, n_jobs=-1)
+
+final_model.fit(X[final_train_rows], y[final_train_rows])
+
+# Trained on arrays: record the column names on the booster itself
+final_model.get_booster().feature_names = FEATURE_COLS
 
 test_preds = final_model.predict(X_test)
 test_preds = np.clip(test_preds, 0, None)
 
-test_wape = wape(y_test.values, test_preds)
-test_bias = np.mean(test_preds - y_test.values)
+test_wape = wape(y_test, test_preds)
+test_bias = np.mean(test_preds - y_test)
 
 print("\n===== Test Set Performance =====")
 print(f"Test WAPE: {test_wape:.4f}")
 print(f"Test Bias: {test_bias:.4f}")
 
-model_path = MODEL_DIR / "demand_xgb.pkl"
-joblib.dump(final_model, model_path)
+model_path, metadata_path = save_native_model(
+    final_model,
+    MODEL_DIR,
+    FEATURE_COLS,
+    metadata={
+        "training_window": {
+            "start": final_train_df["date"].min().date(),
+            "end": final_train_df["date"].max().date(),
+        },
+        "params": XGB_PARAMS,
+        "cv_metrics": metrics,
+        "test_metrics": {
+            "WAPE": float(test_wape),
+            "Bias": float(test_bias),
+            "rows": len(test_df),
+        },
+    },
+)
 
 print(f"\nModel saved to {model_path.resolve()}")
+print(f"Model metadata saved to {metadata_path.resolve()}")
 
 predictions_df = test_df[["date", "product_id"]].copy()
 predictions_df["predicted_units_sold"] = test_preds
 
-output_path = Path("data/processed/demand_predictions.csv")
-predictions_df.to_csv(output_path, index=False)
+write_dataset(predictions_df, PROCESSED_DIR, "demand_predictions")
+
+output_path = dataset_path(PROCESSED_DIR, "demand_predictions")
 
 print(f"Demand predictions saved to {output_path.resolve()}")
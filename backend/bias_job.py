@@ -0,0 +1,467 @@
+"""
+Daily forecast bias job.
+
+Joins the day's demand predictions (the ones pricing used) with
+realized sales, logs them to demand_monitoring and carries 7-day
+rolling bias per SKU, per category and overall forward in
+forecast_bias_state, raising the drift_logic.md §2 alerts.
+"""
+
+import argparse
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import delete, insert, select
+
+from backend.common.alerts import resolve_alerts, upsert_alert
+from backend.common.database import engine
+from backend.common.models import DemandMonitoring, FeatureSnapshot, ForecastBiasState
+from Scripts.build_features import RAW_DIR
+from Scripts.storage import read_dataset
+
+BIAS_WINDOW_DAYS = 7
+
+# Bias as a share of actual units (drift_logic.md §2.1, §2.2)
+OVER_BIAS_THRESHOLD = 0.05
+UNDER_BIAS_THRESHOLD = -0.10
+OVERFORECAST_RATE_THRESHOLD = 0.60
+
+# SKU-level state is kept for analysis; alerts are raised per
+# category and overall only.
+ALERT_SCOPES = ("all", "category")
+
+SUM_COLUMNS = [
+    "predicted_sum",
+    "actual_sum",
+    "error_sum",
+    "overforecast_count",
+    "count",
+]
+
+
+# -----------------------------
+# Daily outcomes
+# -----------------------------
+def load_day_outcomes(run_date):
+    """
+    One row per SKU with both a prediction and realized sales.
+    """
+    with engine.connect() as conn:
+        result = conn.execute(
+            select(
+                FeatureSnapshot.product_id,
+                FeatureSnapshot.category,
+                FeatureSnapshot.predicted_demand.label("predicted_units_sold"),
+            )
+            .where(FeatureSnapshot.snapshot_date == run_date)
+        )
+        predictions = pd.DataFrame(result.all(), columns=list(result.keys()))
+
+    sales = read_dataset(
+        RAW_DIR,
+        "daily_sales",
+        columns=["date", "product_id", "units_sold"],
+        filters=[("date", "==", pd.Timestamp(run_date))],
+    )
+
+    df = predictions.merge(
+        sales[["product_id", "units_sold"]].rename(
+            columns={"units_sold": "actual_units_sold"}
+        ),
+        on="product_id",
+        how="inner",
+    )
+
+    # Same precision as demand_monitoring, so sums carried forward
+    # match sums re-read from the table
+    df["predicted_units_sold"] = df["predicted_units_sold"].round(2)
+    df["actual_units_sold"] = df["actual_units_sold"].astype(float)
+    df["prediction_error"] = (
+        df["predicted_units_sold"] - df["actual_units_sold"]
+    ).round(2)
+    df["overforecast_flag"] = df["predicted_units_sold"] > df["actual_units_sold"]
+
+    return df
+
+
+def load_logged_outcomes(conn, start, end):
+    """
+    demand_monitoring rows for dates in [start, end], each with the
+    category its own day's feature snapshot had, so SKUs missing
+    from later days still count toward their category.
+    """
+    table = DemandMonitoring.__table__
+    snapshot = FeatureSnapshot.__table__
+
+    result = conn.execute(
+        select(
+            table.c.date,
+            table.c.product_id,
+            snapshot.c.category,
+            table.c.predicted_units_sold,
+            table.c.actual_units_sold,
+            table.c.prediction_error,
+            table.c.overforecast_flag,
+        )
+        .select_from(table)
+        .outerjoin(
+            snapshot,
+            (snapshot.c.snapshot_date == table.c.date)
+            & (snapshot.c.product_id == table.c.product_id),
+        )
+        .where(table.c.date >= start)
+        .where(table.c.date <= end)
+    )
+    df = pd.DataFrame(result.all(), columns=list(result.keys()))
+
+    for col in ["predicted_units_sold", "actual_units_sold", "prediction_error"]:
+        df[col] = df[col].astype(float)
+    df["overforecast_flag"] = df["overforecast_flag"].astype(bool)
+
+    return df
+
+
+def _demand_monitoring_rows(df, run_date):
+    return [
+        {
+            "date": run_date,
+            "product_id": product_id,
+            "predicted_units_sold": float(predicted),
+            "actual_units_sold": float(actual),
+            "prediction_error": float(error),
+            "overforecast_flag": bool(over),
+        }
+        for product_id, predicted, actual, error, over in zip(
+            df["product_id"],
+            df["predicted_units_sold"],
+            df["actual_units_sold"],
+            df["prediction_error"],
+            df["overforecast_flag"],
+        )
+    ]
+
+
+# -----------------------------
+# Aggregation
+# -----------------------------
+def daily_sums(df):
+    """
+    Per-(scope, key) sums of one or more days of outcome rows;
+    grouped by date as well when df spans several days.
+    """
+    base = pd.DataFrame({
+        "product_id": df["product_id"],
+        "category": df["category"],
+        "predicted_sum": df["predicted_units_sold"],
+        "actual_sum": df["actual_units_sold"],
+        "error_sum": df["prediction_error"],
+        "overforecast_count": df["overforecast_flag"].astype(int),
+        "count": 1,
+    })
+    by_date = ["date"] if "date" in df.columns else []
+    if by_date:
+        base["date"] = df["date"]
+
+    frames = []
+    for scope, key in [("sku", "product_id"), ("category", "category")]:
+        frames.append(
+            base.groupby(by_date + [key])[SUM_COLUMNS].sum()
+            .reset_index()
+            .rename(columns={key: "key"})
+            .assign(scope=scope)
+        )
+
+    overall = (
+        base.groupby(by_date)[SUM_COLUMNS].sum().reset_index()
+        if by_date
+        else base[SUM_COLUMNS].sum().to_frame().T
+    )
+    frames.append(overall.assign(scope="all", key="all"))
+
+    return pd.concat(frames, ignore_index=True).set_index(
+        by_date + ["scope", "key"]
+    )
+
+
+def _bias_pct(error_sum, actual_sum):
+    """
+    error / actual; any overforecast on zero actuals counts as +inf.
+    """
+    error_sum = np.asarray(error_sum, dtype=float)
+    actual_sum = np.asarray(actual_sum, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = error_sum / actual_sum
+
+    return np.where(
+        actual_sum > 0,
+        pct,
+        np.where(error_sum > 0, np.inf, np.where(error_sum < 0, -np.inf, 0.0)),
+    )
+
+
+def _streak_flags(sums):
+    pct = _bias_pct(sums["error_sum"], sums["actual_sum"])
+    return pct > OVER_BIAS_THRESHOLD, pct < UNDER_BIAS_THRESHOLD
+
+
+# -----------------------------
+# Rolling state
+# -----------------------------
+def _state_frame(sums, over_streak, under_streak, run_date):
+    state = sums[SUM_COLUMNS].rename(
+        columns={c: f"{c}_7d" for c in SUM_COLUMNS}
+    )
+    state["over_bias_streak"] = np.minimum(over_streak, BIAS_WINDOW_DAYS)
+    state["under_bias_streak"] = np.minimum(under_streak, BIAS_WINDOW_DAYS)
+    state["as_of"] = run_date
+
+    return state[state["count_7d"] > 0].reset_index()
+
+
+def roll_bias_state(prev, today, expired, run_date):
+    """
+    Carry yesterday's state forward one day: add today's sums,
+    subtract the day that left the window, extend or reset streaks.
+    """
+    prev = prev.set_index(["scope", "key"])
+    keys = prev.index.union(today.index)
+
+    sums = (
+        prev.reindex(keys)[[f"{c}_7d" for c in SUM_COLUMNS]]
+        .set_axis(SUM_COLUMNS, axis=1)
+        .fillna(0)
+        .add(today.reindex(keys, fill_value=0)[SUM_COLUMNS])
+        .sub(expired.reindex(keys, fill_value=0)[SUM_COLUMNS])
+    )
+
+    over_today, under_today = _streak_flags(today.reindex(keys, fill_value=0))
+    seen_today = keys.isin(today.index)
+
+    prev_over = prev["over_bias_streak"].reindex(keys, fill_value=0).to_numpy()
+    prev_under = prev["under_bias_streak"].reindex(keys, fill_value=0).to_numpy()
+
+    over = np.where(seen_today & over_today, prev_over + 1, 0)
+    under = np.where(seen_today & under_today, prev_under + 1, 0)
+
+    return _state_frame(sums, over, under, run_date)
+
+
+def rebuild_bias_state(window, run_date):
+    """
+    State from scratch over the last BIAS_WINDOW_DAYS of logged rows
+    (first run, or after a skipped day / rerun).
+    """
+    per_day = daily_sums(window)
+    sums = per_day.groupby(level=["scope", "key"])[SUM_COLUMNS].sum()
+
+    days = pd.date_range(
+        run_date - timedelta(days=BIAS_WINDOW_DAYS - 1), run_date
+    ).date
+
+    over_flags, under_flags = _streak_flags(per_day)
+    flags = pd.DataFrame(
+        {"over": over_flags, "under": under_flags}, index=per_day.index
+    )
+
+    streaks = {}
+    for name in ["over", "under"]:
+        # keys x days, most recent day first; missing days break a streak
+        grid = (
+            flags[name].unstack("date")
+            .reindex(index=sums.index, columns=days[::-1])
+            .fillna(False)
+            .to_numpy(dtype=bool)
+        )
+        broken = ~grid
+        streaks[name] = np.where(
+            broken.any(axis=1), broken.argmax(axis=1), BIAS_WINDOW_DAYS
+        )
+
+    return _state_frame(sums, streaks["over"], streaks["under"], run_date)
+
+
+def _window_state(conn, run_date):
+    window = load_logged_outcomes(
+        conn,
+        run_date - timedelta(days=BIAS_WINDOW_DAYS - 1),
+        run_date,
+    )
+    return rebuild_bias_state(window, run_date)
+
+
+def check_bias_state(conn, state, run_date):
+    """
+    Raise if state differs from a rebuild over the logged window, e.g.
+    because the rolled sums drifted.
+    """
+    columns = [f"{c}_7d" for c in SUM_COLUMNS] + [
+        "over_bias_streak",
+        "under_bias_streak",
+    ]
+
+    rolled = state.set_index(["scope", "key"]).sort_index()[columns]
+    rebuilt = (
+        _window_state(conn, run_date)
+        .set_index(["scope", "key"]).sort_index()[columns]
+    )
+
+    same = rolled.index.equals(rebuilt.index) and np.allclose(
+        rolled.to_numpy(dtype=float), rebuilt.to_numpy(dtype=float), atol=1e-6
+    )
+
+    if not same:
+        raise RuntimeError(
+            f"Rolled forecast bias state for {run_date} does not match "
+            f"a rebuild of the window"
+        )
+
+
+def load_bias_state(conn):
+    table = ForecastBiasState.__table__
+    result = conn.execute(select(table))
+    return pd.DataFrame(result.all(), columns=list(result.keys()))
+
+
+def write_bias_state(conn, state):
+    table = ForecastBiasState.__table__
+
+    conn.execute(delete(table))
+    if len(state):
+        conn.execute(insert(table), state.to_dict("records"))
+
+
+# -----------------------------
+# Alerts
+# -----------------------------
+def apply_bias_alerts(conn, state, run_date):
+    """
+    drift_logic.md §2.1 / §2.2 rules for the overall and per-category
+    rows of the rolling state.
+    """
+    rows = state[state["scope"].isin(ALERT_SCOPES)]
+
+    bias_7d = _bias_pct(rows["error_sum_7d"], rows["actual_sum_7d"])
+    overforecast_rate = rows["overforecast_count_7d"] / rows["count_7d"]
+
+    for (scope, key, over, under), bias, rate in zip(
+        rows[["scope", "key", "over_bias_streak", "under_bias_streak"]]
+        .itertuples(index=False),
+        bias_7d,
+        overforecast_rate,
+    ):
+        metric = "all" if scope == "all" else f"{scope}:{key}"
+        bias_value = round(float(bias), 4) if np.isfinite(bias) else None
+
+        if over >= BIAS_WINDOW_DAYS:
+            upsert_alert(
+                conn,
+                "forecast_bias_over",
+                "warning",
+                f"Forecast bias > +5% for {BIAS_WINDOW_DAYS} days ({metric}): "
+                f"stock-out risk, clip predictions downward",
+                run_date,
+                metric_name=metric,
+                metric_value=bias_value,
+                threshold=OVER_BIAS_THRESHOLD,
+            )
+        else:
+            resolve_alerts(conn, "forecast_bias_over", metric)
+
+        if under >= BIAS_WINDOW_DAYS:
+            upsert_alert(
+                conn,
+                "forecast_bias_under",
+                "warning",
+                f"Forecast bias < -10% for {BIAS_WINDOW_DAYS} days ({metric}): "
+                f"revenue under-optimization, retraining triggered",
+                run_date,
+                metric_name=metric,
+                metric_value=bias_value,
+                threshold=UNDER_BIAS_THRESHOLD,
+            )
+        else:
+            resolve_alerts(conn, "forecast_bias_under", metric)
+
+        if rate > OVERFORECAST_RATE_THRESHOLD:
+            upsert_alert(
+                conn,
+                "overforecast_rate",
+                "warning",
+                f"Overforecast rate {rate:.0%} over {BIAS_WINDOW_DAYS} days "
+                f"({metric}): model too optimistic",
+                run_date,
+                metric_name=metric,
+                metric_value=round(float(rate), 4),
+                threshold=OVERFORECAST_RATE_THRESHOLD,
+            )
+        else:
+            resolve_alerts(conn, "overforecast_rate", metric)
+
+
+# -----------------------------
+# Job
+# -----------------------------
+def run_bias_job(run_date=None, check=False):
+    """
+    Monitor run_date (default: yesterday, the last day with sales).
+    With check, a rolled-forward state is compared against a rebuild
+    of the window before it is saved.
+    """
+    if run_date is None:
+        run_date = date.today() - timedelta(days=1)
+
+    outcomes = load_day_outcomes(run_date)
+
+    if outcomes.empty:
+        print(f"No predictions with realized sales for {run_date}")
+        return None
+
+    table = DemandMonitoring.__table__
+
+    with engine.begin() as conn:
+        conn.execute(delete(table).where(table.c.date == run_date))
+        conn.execute(insert(table), _demand_monitoring_rows(outcomes, run_date))
+
+        prev = load_bias_state(conn)
+
+        if not prev.empty and (prev["as_of"] == run_date - timedelta(days=1)).all():
+            expired_day = run_date - timedelta(days=BIAS_WINDOW_DAYS)
+            expired = load_logged_outcomes(
+                conn, expired_day, expired_day
+            ).drop(columns="date")
+            state = roll_bias_state(
+                prev, daily_sums(outcomes), daily_sums(expired), run_date
+            )
+
+            if check:
+                check_bias_state(conn, state, run_date)
+        else:
+            state = _window_state(conn, run_date)
+
+        write_bias_state(conn, state)
+        apply_bias_alerts(conn, state, run_date)
+
+    overall = state[state["scope"] == "all"].iloc[0]
+    bias = _bias_pct(overall["error_sum_7d"], overall["actual_sum_7d"])
+
+    print(
+        f"Logged {len(outcomes)} SKU forecasts for {run_date}; "
+        f"7-day bias {float(bias):+.1%}"
+    )
+
+    return state
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monitor forecast bias")
+    parser.add_argument("--date", type=date.fromisoformat)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Verify the rolled state against a rebuild of the window",
+    )
+    args = parser.parse_args()
+
+    run_bias_job(args.date, check=args.check)
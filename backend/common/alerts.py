@@ -0,0 +1,66 @@
+from sqlalchemy import insert, select, update
+
+from backend.common.models import Alert
+
+
+def upsert_alert(
+    conn,
+    alert_type,
+    severity,
+    message,
+    day,
+    metric_name=None,
+    metric_value=None,
+    threshold=None,
+):
+    """
+    Keep one active alert per (alert_type, metric_name): extend the
+    open one's last_seen and latest value, or open a new one.
+    """
+    table = Alert.__table__
+
+    values = {
+        "severity": severity,
+        "message": message,
+        "metric_value": metric_value,
+        "threshold": threshold,
+        "last_seen": day,
+    }
+
+    alert_id = conn.execute(
+        select(table.c.id)
+        .where(table.c.status == "active")
+        .where(table.c.alert_type == alert_type)
+        .where(table.c.metric_name == metric_name)
+        .order_by(table.c.id.desc())
+        .limit(1)
+    ).scalar()
+
+    if alert_id is not None:
+        conn.execute(update(table).where(table.c.id == alert_id).values(values))
+        return alert_id
+
+    return conn.execute(
+        insert(table).values(
+            alert_type=alert_type,
+            metric_name=metric_name,
+            status="active",
+            first_seen=day,
+            **values,
+        )
+    ).inserted_primary_key[0]
+
+
+def resolve_alerts(conn, alert_type, metric_name=None):
+    """
+    Close active alerts whose condition has cleared.
+    """
+    table = Alert.__table__
+
+    return conn.execute(
+        update(table)
+        .where(table.c.status == "active")
+        .where(table.c.alert_type == alert_type)
+        .where(table.c.metric_name == metric_name)
+        .values(status="resolved")
+    ).rowcount
@@ -11,17 +11,35 @@ class Settings:
 
     # Database
     DATABASE_URL = os.getenv("DATABASE_URL")
+    # Async engine pool (FastAPI service)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
 
     # FastAPI
     FASTAPI_HOST = os.getenv("FASTAPI_HOST", "127.0.0.1")
     FASTAPI_PORT = int(os.getenv("FASTAPI_PORT", "8000"))
+    SKU_CACHE_TTL_SECONDS = float(os.getenv("SKU_CACHE_TTL_SECONDS", "300"))
+    SKU_CACHE_MAX_ENTRIES = int(os.getenv("SKU_CACHE_MAX_ENTRIES", "2048"))
+    DECISION_GENERATION_POLL_SECONDS = float(
+        os.getenv("DECISION_GENERATION_POLL_SECONDS", "5")
+    )
 
     # Flask
     FLASK_HOST = os.getenv("FLASK_HOST", "127.0.0.1")
     FLASK_PORT = int(os.getenv("FLASK_PORT", "5000"))
+    FLASK_HTTP_POOL_SIZE = int(os.getenv("FLASK_HTTP_POOL_SIZE", "16"))
+    FLASK_STATUS_CACHE_SECONDS = float(os.getenv("FLASK_STATUS_CACHE_SECONDS", "2"))
+
+    # Overrides
+    OVERRIDE_CACHE_TTL_SECONDS = float(os.getenv("OVERRIDE_CACHE_TTL_SECONDS", "5"))
 
     # Jobs
     PRICING_TIMEZONE = os.getenv("PRICING_TIMEZONE", "UTC")
+    PRICING_SHARDS = int(os.getenv("PRICING_SHARDS", "1"))
+    PRICING_READ_BATCH_SIZE = int(os.getenv("PRICING_READ_BATCH_SIZE", "5000"))
+    PRICING_WRITE_CHUNK_SIZE = int(os.getenv("PRICING_WRITE_CHUNK_SIZE", "1000"))
 
     # ML
     MODEL_DIR = os.getenv("MODEL_DIR", "models/")
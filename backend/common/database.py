@@ -1,4 +1,8 @@
-from sqlalchemy import create_engine
+import io
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from backend.common.config import settings
@@ -34,3 +38,110 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ------------------------
+# Async engine (FastAPI)
+# ------------------------
+# Created on first use, so processes that never touch it (jobs,
+# Flask) do not need the async driver installed.
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+_async_engine = None
+_AsyncSessionLocal = None
+
+
+def async_database_url(url):
+    url = make_url(url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+
+    return url.set(drivername=driver) if driver else url
+
+
+def get_async_engine():
+    global _async_engine
+
+    if _async_engine is None:
+        url = async_database_url(settings.DATABASE_URL)
+        pool_args = {}
+
+        # Local SQLite files never drop connections; skip the per-
+        # checkout ping there, it costs a thread hop per request.
+        if url.get_backend_name() != "sqlite":
+            pool_args = {
+                "pool_pre_ping": True,
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_timeout": settings.DB_POOL_TIMEOUT,
+                "pool_recycle": settings.DB_POOL_RECYCLE,
+            }
+
+        _async_engine = create_async_engine(url, **pool_args)
+
+    return _async_engine
+
+
+def get_async_sessionmaker():
+    global _AsyncSessionLocal
+
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+
+    return _AsyncSessionLocal
+
+
+async def dispose_async_engine():
+    global _async_engine, _AsyncSessionLocal
+
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _AsyncSessionLocal = None
+
+
+# ------------------------
+# Async dependency (FastAPI)
+# ------------------------
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+# ------------------------
+# Bulk load (jobs)
+# ------------------------
+def bulk_insert(conn, table, df):
+    """
+    Append a DataFrame's rows to table inside conn's transaction.
+
+    PostgreSQL gets a single COPY, which loads 100k+ rows in well
+    under a second; other backends fall back to executemany.
+    """
+    if df.empty:
+        return 0
+
+    if conn.dialect.name == "postgresql":
+        buf = io.StringIO()
+        df.to_csv(buf, index=False, header=False)
+        buf.seek(0)
+
+        columns = ", ".join(f'"{c}"' for c in df.columns)
+        cursor = conn.connection.driver_connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({columns}) FROM STDIN WITH (FORMAT csv)",
+                buf,
+            )
+        finally:
+            cursor.close()
+    else:
+        conn.execute(insert(table), df.to_dict("records"))
+
+    return len(df)
@@ -0,0 +1,193 @@
+"""
+Demand model registry.
+
+Resolves settings.ACTIVE_MODEL_VERSION under settings.MODEL_DIR and
+loads that model once per process. Versions live in
+MODEL_DIR/<version>/; "latest" picks the newest version directory,
+falling back to the unversioned files train_demand_model.py writes
+at the top of MODEL_DIR.
+
+Version names are ordered naturally: runs of digits compare as
+numbers, the rest as text, so v10 is newer than v9 and timestamped
+names (e.g. 20250701T0200) sort by time. The resolution is cached
+for the life of the process; a newly registered version is picked
+up on restart, or after reset_model_cache().
+
+Models are read from XGBoost's native format when exported (see
+Scripts/model_export.py), with the feature order taken from the
+metadata sidecar. Load the model in a parent process before forking
+workers and they share its memory copy-on-write instead of each
+loading their own.
+"""
+
+import re
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from backend.common.config import settings
+from Scripts.model_export import find_model_file, load_booster, load_metadata
+
+LATEST = "latest"
+
+# Training one-hot encodes category with this prefix
+CATEGORY_PREFIX = "category_"
+
+_lock = threading.Lock()
+_loaded = {}
+_resolved = {}
+
+
+class DemandModel:
+    """
+    A loaded booster plus the feature columns it was trained on, in
+    training order, and its sidecar metadata.
+    """
+
+    def __init__(self, version, path, booster, feature_cols, metadata=None):
+        self.version = version
+        self.path = path
+        self.booster = booster
+        self.feature_cols = list(feature_cols)
+        self.metadata = metadata or {}
+
+    def feature_matrix(self, features):
+        """
+        Training-ordered float32 matrix for a feature frame as built
+        by Scripts.build_features (category not yet one-hot encoded).
+        Columns the frame lacks are zero.
+        """
+        X = np.zeros((len(features), len(self.feature_cols)), dtype=np.float32)
+
+        for j, col in enumerate(self.feature_cols):
+            if col in features.columns:
+                X[:, j] = features[col].to_numpy(dtype=np.float32)
+            elif col.startswith(CATEGORY_PREFIX) and "category" in features.columns:
+                X[:, j] = features["category"].to_numpy() == col[len(CATEGORY_PREFIX):]
+
+        return X
+
+    def predict(self, features):
+        """
+        Predicted units sold for every row of features, in one call.
+        """
+        if len(features) == 0:
+            return np.zeros(0)
+
+        # inplace_predict scores the array directly, without a DMatrix
+        preds = self.booster.inplace_predict(self.feature_matrix(features))
+
+        return np.clip(preds, 0, None)
+
+
+def version_sort_key(name):
+    """
+    Natural sort key for a version name: "v10" -> ("v", 10, "").
+    """
+    # re.split with a group alternates text and digits, so keys of
+    # different names always compare str to str and int to int
+    return tuple(
+        int(part) if i % 2 else part
+        for i, part in enumerate(re.split(r"(\d+)", name))
+    )
+
+
+def resolve_model_path(version=None, model_dir=None):
+    """
+    (version, path) of the model file for version, or (version, None)
+    if nothing is registered under it.
+    """
+    version = version or settings.ACTIVE_MODEL_VERSION
+    model_dir = Path(model_dir or settings.MODEL_DIR)
+
+    if version != LATEST:
+        return version, find_model_file(model_dir / version)
+
+    versions = []
+    if model_dir.is_dir():
+        versions = sorted(
+            (
+                p.name for p in model_dir.iterdir()
+                if p.is_dir() and find_model_file(p) is not None
+            ),
+            key=version_sort_key,
+        )
+
+    if versions:
+        return versions[-1], find_model_file(model_dir / versions[-1])
+
+    return LATEST, find_model_file(model_dir)
+
+
+def load_model(version, path):
+    metadata = load_metadata(path.parent)
+    booster = load_booster(path)
+
+    feature_cols = metadata.get("feature_cols") or booster.feature_names
+
+    if not feature_cols:
+        raise ValueError(f"No feature order recorded for model {path}")
+
+    return DemandModel(version, path, booster, feature_cols, metadata)
+
+
+def reset_model_cache():
+    """
+    Forget resolved versions and loaded models, so the next call
+    rescans MODEL_DIR (e.g. after registering a new version).
+    """
+    with _lock:
+        _resolved.clear()
+        _loaded.clear()
+
+
+def get_active_model(version=None):
+    """
+    The active demand model, loaded on first use and reused by every
+    later call in this process. None if no model is registered.
+    """
+    version = version or settings.ACTIVE_MODEL_VERSION
+
+    with _lock:
+        resolved = _resolved.get(version)
+
+    if resolved is None:
+        resolved = resolve_model_path(version)
+
+        # Misses are not cached: a model trained later is still found
+        if resolved[1] is not None:
+            with _lock:
+                _resolved[version] = resolved
+
+    version, path = resolved
+
+    if path is None:
+        if version != LATEST:
+            raise FileNotFoundError(
+                f"Model version {version!r} not found in {settings.MODEL_DIR}"
+            )
+        return None
+
+    key = str(path.resolve())
+
+    with _lock:
+        if key not in _loaded:
+            _loaded[key] = load_model(version, path)
+            print(f"Loaded demand model {version} from {path}")
+
+        return _loaded[key]
+
+
+def predict_demand(features):
+    """
+    Batch-predict demand for a day's feature frame with the active
+    model; None when no model is registered yet.
+    """
+    model = get_active_model()
+
+    if model is None:
+        return None
+
+    return pd.Series(model.predict(features), index=features.index)
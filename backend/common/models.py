@@ -7,6 +7,8 @@ from sqlalchemy import (
     Boolean,
     JSON,
     TIMESTAMP,
+    Index,
+    UniqueConstraint,
 )
 
 from sqlalchemy.sql import func
@@ -33,6 +35,14 @@ class FeatureSnapshot(Base):
 
     category = Column(String, nullable=False)
 
+    __table_args__ = (
+        # One snapshot per SKU per day; also serves the by-date scans
+        UniqueConstraint(
+            "snapshot_date", "product_id",
+            name="uq_feature_snapshots_date_product",
+        ),
+    )
+
 
 class PricingDecision(Base):
     __tablename__ = "pricing_decisions"
@@ -59,6 +69,19 @@ class PricingDecision(Base):
         server_default=func.now()
     )
 
+    __table_args__ = (
+        # Per-SKU lookups: latest decision, history
+        Index(
+            "ix_pricing_decisions_product_date",
+            "product_id", "decision_date",
+        ),
+        # Per-run scans: reconciliation, rollups
+        Index(
+            "ix_pricing_decisions_date_product",
+            "decision_date", "product_id",
+        ),
+    )
+
 
 class Alert(Base):
     __tablename__ = "alerts"
@@ -81,6 +104,17 @@ class Alert(Base):
         server_default=func.now()
     )
 
+    __table_args__ = (
+        # Serves the active-alerts listing: filter on status, rows
+        # already in (severity DESC, first_seen) order
+        Index(
+            "ix_alerts_status_severity_first_seen",
+            status,
+            severity.desc(),
+            first_seen,
+        ),
+    )
+
 class ManualOverride(Base):
     __tablename__ = "manual_overrides"
 
@@ -113,3 +147,112 @@ class RetrainingEvent(Base):
         server_default=func.now()
     )
 
+
+
+class InventoryMonitoring(Base):
+    __tablename__ = "inventory_monitoring"
+
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, nullable=False)
+    product_id = Column(String, nullable=False)
+
+    opening_inventory = Column(Integer)
+    units_sold = Column(Integer)
+    closing_inventory = Column(Integer)
+    stockout_flag = Column(Boolean)
+    days_of_stock = Column(Numeric(8, 2))
+
+    created_at = Column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "date", "product_id",
+            name="uq_inventory_monitoring_date_product",
+        ),
+    )
+
+
+class DailyKPI(Base):
+    __tablename__ = "daily_kpis"
+
+    date = Column(Date, primary_key=True)
+    total_revenue = Column(Numeric(14, 2))
+    revenue_per_sku = Column(Numeric(10, 2))
+    stockout_rate = Column(Numeric(6, 4))
+    clearance_misses = Column(Integer)
+
+
+class FeatureMonitoring(Base):
+    __tablename__ = "feature_monitoring"
+
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, nullable=False)
+    feature_name = Column(String, nullable=False)
+
+    feature_mean = Column(Numeric(10, 4))
+    feature_std = Column(Numeric(10, 4))
+    feature_p50 = Column(Numeric(10, 4))
+    feature_p90 = Column(Numeric(10, 4))
+    psi = Column(Numeric(10, 4))
+
+    created_at = Column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "date", "feature_name",
+            name="uq_feature_monitoring_date_feature",
+        ),
+    )
+
+
+class DemandMonitoring(Base):
+    __tablename__ = "demand_monitoring"
+
+    id = Column(Integer, primary_key=True)
+    date = Column(Date, nullable=False)
+    product_id = Column(String, nullable=False)
+
+    predicted_units_sold = Column(Numeric(10, 2), nullable=False)
+    actual_units_sold = Column(Numeric(10, 2))
+    prediction_error = Column(Numeric(10, 2))
+    overforecast_flag = Column(Boolean)
+
+    created_at = Column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "date", "product_id",
+            name="uq_demand_monitoring_date_product",
+        ),
+    )
+
+
+class ForecastBiasState(Base):
+    """
+    Rolling 7-day forecast bias per scope ("sku", "category", "all"),
+    carried forward day by day by the bias job.
+    """
+    __tablename__ = "forecast_bias_state"
+
+    scope = Column(String, primary_key=True)
+    key = Column(String, primary_key=True)
+    as_of = Column(Date, nullable=False)
+
+    predicted_sum_7d = Column(Float, nullable=False)
+    actual_sum_7d = Column(Float, nullable=False)
+    error_sum_7d = Column(Float, nullable=False)
+    overforecast_count_7d = Column(Integer, nullable=False)
+    count_7d = Column(Integer, nullable=False)
+
+    # Consecutive days with daily bias above / below threshold
+    over_bias_streak = Column(Integer, nullable=False)
+    under_bias_streak = Column(Integer, nullable=False)
@@ -1,26 +1,161 @@
+"""
+Manual override state.
+
+Readers on hot paths (status endpoint, every admin page render) get
+the active override set from a short-TTL in-process cache. Writers
+call notify_overrides_changed() in the same transaction as the
+change. Only once that transaction commits is the local cache
+cleared and, on PostgreSQL, a NOTIFY delivered to every process
+running start_override_listener() so they drop theirs; a rollback
+leaves every cache as it was. Elsewhere, other processes see the
+change within OVERRIDE_CACHE_TTL_SECONDS.
+"""
+
+import select as io_select
+import threading
 from datetime import datetime
 
-from backend.common.database import SessionLocal
+from sqlalchemy import event, select, text
+
+from backend.common.cache import TTLCache
+from backend.common.config import settings
+from backend.common.database import SessionLocal, engine
 from backend.common.models import ManualOverride
 
+OVERRIDES_CHANNEL = "manual_overrides_changed"
 
-def get_active_overrides():
-    db = SessionLocal()
+_cache = TTLCache(maxsize=1, ttl=settings.OVERRIDE_CACHE_TTL_SECONDS)
+_listener_stop = None
 
-    try:
-        now = datetime.utcnow()
-
-        overrides = (
-            db.query(ManualOverride)
-            .filter(ManualOverride.active.is_(True))
-            .filter(
-                (ManualOverride.expires_at.is_(None)) |
-                (ManualOverride.expires_at > now)
-            )
-            .all()
+
+def _active_overrides_query():
+    now = datetime.utcnow()
+
+    return (
+        select(ManualOverride.override_type)
+        .where(ManualOverride.active.is_(True))
+        .where(
+            (ManualOverride.expires_at.is_(None)) |
+            (ManualOverride.expires_at > now)
         )
+    )
+
+
+def _load_active_overrides():
+    db = SessionLocal()
 
-        return {o.override_type for o in overrides}
+    try:
+        return frozenset(db.execute(_active_overrides_query()).scalars())
 
     finally:
         db.close()
+
+
+def get_active_overrides(use_cache=True):
+    """
+    Set of active override types. Pass use_cache=False where a stale
+    read is not acceptable (e.g. the pricing job itself).
+    """
+    if not use_cache:
+        return _load_active_overrides()
+
+    overrides = _cache.get("active")
+
+    if overrides is None:
+        overrides = _load_active_overrides()
+        _cache.set("active", overrides)
+
+    return overrides
+
+
+async def get_active_overrides_async(db):
+    """
+    get_active_overrides() for async handlers, on AsyncSession db.
+    """
+    overrides = _cache.get("active")
+
+    if overrides is None:
+        result = await db.execute(_active_overrides_query())
+        overrides = frozenset(result.scalars())
+        _cache.set("active", overrides)
+
+    return overrides
+
+
+def invalidate_overrides():
+    _cache.clear()
+
+
+def notify_overrides_changed(db):
+    """
+    Call before committing a manual_overrides write on session db.
+
+    The local cache is cleared once the commit succeeds; clearing it
+    earlier would let a concurrent read re-cache the old state.
+    """
+    event.listen(
+        db, "after_commit", lambda session: invalidate_overrides(), once=True
+    )
+
+    if engine.dialect.name == "postgresql":
+        # Delivered to listeners only if the transaction commits
+        db.execute(
+            text("SELECT pg_notify(:channel, '')"),
+            {"channel": OVERRIDES_CHANNEL},
+        )
+
+
+# -----------------------------
+# Cross-process invalidation
+# -----------------------------
+def _listen(stop, poll_seconds=5.0):
+    while not stop.is_set():
+        try:
+            raw = engine.raw_connection()
+            # Autocommit LISTEN connection; keep it out of the pool
+            raw.detach()
+
+            try:
+                conn = raw.driver_connection
+                conn.autocommit = True
+
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {OVERRIDES_CHANNEL}")
+
+                # Changes made while we were not listening
+                invalidate_overrides()
+
+                while not stop.is_set():
+                    if io_select.select([conn], [], [], poll_seconds)[0]:
+                        conn.poll()
+                        if conn.notifies:
+                            conn.notifies.clear()
+                            invalidate_overrides()
+            finally:
+                raw.close()
+
+        except Exception as exc:
+            print(f"Override listener error: {exc}; retrying")
+            stop.wait(poll_seconds)
+
+
+def start_override_listener():
+    """
+    Start a background LISTEN thread (PostgreSQL + psycopg2 only).
+    Returns an Event that stops it, or None if not supported.
+    """
+    global _listener_stop
+
+    if engine.dialect.name != "postgresql" or engine.dialect.driver != "psycopg2":
+        return None
+
+    if _listener_stop is None:
+        _listener_stop = threading.Event()
+        threading.Thread(
+            target=_listen,
+            args=(_listener_stop,),
+            name="override-listener",
+            daemon=True,
+        ).start()
+
+    return _listener_stop
@@ -0,0 +1,282 @@
+"""
+Daily input drift job.
+
+Scores the day's feature distribution against a rolling 30-day
+baseline with PSI (drift_logic.md §1.1), writes per-feature stats to
+feature_monitoring and raises or clears input drift alerts.
+"""
+
+import argparse
+import json
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import delete, insert, select
+
+from backend.common.alerts import resolve_alerts, upsert_alert
+from backend.common.database import engine
+from backend.common.models import FeatureMonitoring
+from Scripts.build_features import PROCESSED_DIR
+from Scripts.storage import dataset_fingerprint, read_dataset
+
+MONITORED_FEATURES = ["sales_roll_mean_7", "rel_price", "inventory_pressure"]
+
+BASELINE_DAYS = 30
+N_BINS = 10
+
+PSI_WARNING = 0.2
+PSI_CRITICAL = 0.3
+WARNING_CONSECUTIVE_DAYS = 3
+
+# Avoids log(0) / division by zero for empty bins
+PSI_EPSILON = 1e-4
+
+BASELINE_CACHE_DIR = PROCESSED_DIR / "drift_baselines"
+
+
+def load_feature_values(start, end):
+    """
+    Monitored feature values for dates in [start, end], as a
+    (rows x features) float array. Non-finite values are dropped.
+    """
+    df = read_dataset(
+        PROCESSED_DIR,
+        "model_features",
+        columns=["date", *MONITORED_FEATURES],
+        filters=[
+            ("date", ">=", pd.Timestamp(start)),
+            ("date", "<=", pd.Timestamp(end)),
+        ],
+    )
+
+    values = df[MONITORED_FEATURES].to_numpy(dtype=np.float64)
+
+    return values[np.isfinite(values).all(axis=1)]
+
+
+# -----------------------------
+# Baseline bins
+# -----------------------------
+def compute_baseline(values):
+    """
+    Per-feature quantile bin edges over the baseline rows and the
+    share of baseline rows falling in each bin.
+    """
+    quantiles = np.quantile(values, np.linspace(0, 1, N_BINS + 1)[1:-1], axis=0)
+
+    baseline = {}
+    for j, feature in enumerate(MONITORED_FEATURES):
+        # Ties (e.g. many zero-sales SKUs) collapse duplicate edges
+        edges = np.unique(quantiles[:, j])
+        counts = np.bincount(
+            np.searchsorted(edges, values[:, j], side="right"),
+            minlength=len(edges) + 1,
+        )
+        baseline[feature] = {
+            "edges": edges.tolist(),
+            "expected_pct": (counts / counts.sum()).tolist(),
+        }
+
+    return baseline
+
+
+def load_baseline(run_date):
+    """
+    Baseline for the BASELINE_DAYS before run_date, computed once per
+    window and cached on disk. Each cached window stores the stat()
+    fingerprint of the model_features files it was built from, so
+    rewritten history in the window recomputes it; other windows'
+    files are pruned.
+    """
+    end = run_date - timedelta(days=1)
+    start = run_date - timedelta(days=BASELINE_DAYS)
+
+    path = BASELINE_CACHE_DIR / f"{start}_{end}.json"
+    fingerprint = dataset_fingerprint(PROCESSED_DIR, "model_features", start, end)
+
+    if path.exists():
+        cached = json.loads(path.read_text())
+        if cached.get("fingerprint") == fingerprint:
+            return cached["baseline"]
+
+    values = load_feature_values(start, end)
+
+    if len(values) == 0:
+        return None
+
+    baseline = compute_baseline(values)
+
+    BASELINE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"fingerprint": fingerprint, "baseline": baseline}))
+
+    for stale in BASELINE_CACHE_DIR.glob("*.json"):
+        if stale != path:
+            stale.unlink()
+
+    return baseline
+
+
+# -----------------------------
+# Scoring
+# -----------------------------
+def score_day(values, baseline):
+    """
+    PSI and summary stats for every monitored feature in one pass:
+    bin indices are offset per feature so a single bincount yields
+    all histograms.
+    """
+    offsets = np.cumsum(
+        [0] + [len(baseline[f]["expected_pct"]) for f in MONITORED_FEATURES]
+    )
+
+    bins = np.concatenate([
+        np.searchsorted(baseline[f]["edges"], values[:, j], side="right")
+        + offsets[j]
+        for j, f in enumerate(MONITORED_FEATURES)
+    ])
+
+    actual = np.bincount(bins, minlength=offsets[-1]) / len(values)
+    expected = np.concatenate(
+        [baseline[f]["expected_pct"] for f in MONITORED_FEATURES]
+    )
+
+    actual = np.clip(actual, PSI_EPSILON, None)
+    expected = np.clip(expected, PSI_EPSILON, None)
+    contrib = (actual - expected) * np.log(actual / expected)
+
+    psi = np.add.reduceat(contrib, offsets[:-1])
+
+    mean = values.mean(axis=0)
+    std = values.std(axis=0, ddof=1) if len(values) > 1 else np.zeros_like(mean)
+    p50, p90 = np.percentile(values, [50, 90], axis=0)
+
+    return [
+        {
+            "feature_name": feature,
+            "feature_mean": round(float(mean[j]), 4),
+            "feature_std": round(float(std[j]), 4),
+            "feature_p50": round(float(p50[j]), 4),
+            "feature_p90": round(float(p90[j]), 4),
+            "psi": round(float(psi[j]), 4),
+        }
+        for j, feature in enumerate(MONITORED_FEATURES)
+    ]
+
+
+# -----------------------------
+# Persistence & alerts
+# -----------------------------
+def _recent_psi(conn, run_date):
+    """
+    {feature: {date: psi}} for the WARNING_CONSECUTIVE_DAYS dates
+    ending at run_date (dates that were not scored are absent).
+    """
+    table = FeatureMonitoring.__table__
+    start = run_date - timedelta(days=WARNING_CONSECUTIVE_DAYS - 1)
+
+    rows = conn.execute(
+        select(table.c.feature_name, table.c.date, table.c.psi)
+        .where(table.c.date >= start)
+        .where(table.c.date <= run_date)
+    )
+
+    recent = {}
+    for feature, day, psi in rows:
+        recent.setdefault(feature, {})[day] = float(psi or 0.0)
+
+    return recent
+
+
+def apply_drift_alerts(conn, run_date):
+    """
+    drift_logic.md §1.1 alert rules, evaluated per feature.
+    """
+    recent = _recent_psi(conn, run_date)
+
+    for feature in MONITORED_FEATURES:
+        history = recent.get(feature, {})
+        psi_today = history.get(run_date, 0.0)
+
+        # PSI >= 0.3 on any day -> freeze price increases
+        if psi_today >= PSI_CRITICAL:
+            upsert_alert(
+                conn,
+                "input_drift_severe",
+                "critical",
+                f"PSI {psi_today:.2f} for {feature}: freeze price increases",
+                run_date,
+                metric_name=feature,
+                metric_value=psi_today,
+                threshold=PSI_CRITICAL,
+            )
+        else:
+            resolve_alerts(conn, "input_drift_severe", feature)
+
+        # PSI >= 0.2 for 3 consecutive days -> schedule retraining
+        sustained = (
+            len(history) == WARNING_CONSECUTIVE_DAYS
+            and min(history.values()) >= PSI_WARNING
+        )
+
+        if sustained:
+            upsert_alert(
+                conn,
+                "input_drift",
+                "warning",
+                f"PSI exceeded threshold for {feature} "
+                f"{WARNING_CONSECUTIVE_DAYS} days running: schedule retraining",
+                run_date,
+                metric_name=feature,
+                metric_value=psi_today,
+                threshold=PSI_WARNING,
+            )
+        elif psi_today < PSI_WARNING:
+            resolve_alerts(conn, "input_drift", feature)
+
+
+def write_feature_monitoring(stats, run_date):
+    """
+    Replace run_date's feature stats and re-evaluate drift alerts in
+    one transaction.
+    """
+    table = FeatureMonitoring.__table__
+    rows = [{"date": run_date, **s} for s in stats]
+
+    with engine.begin() as conn:
+        conn.execute(delete(table).where(table.c.date == run_date))
+        conn.execute(insert(table), rows)
+        apply_drift_alerts(conn, run_date)
+
+
+def run_drift_job(run_date=None):
+    if run_date is None:
+        run_date = date.today()
+
+    baseline = load_baseline(run_date)
+
+    if baseline is None:
+        print(f"No baseline features before {run_date}; drift not scored")
+        return None
+
+    values = load_feature_values(run_date, run_date)
+
+    if len(values) == 0:
+        print(f"No features for {run_date}; drift not scored")
+        return None
+
+    stats = score_day(values, baseline)
+    write_feature_monitoring(stats, run_date)
+
+    for s in stats:
+        print(f"PSI {s['feature_name']}: {s['psi']}")
+
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score input drift (PSI)")
+    parser.add_argument("--date", type=date.fromisoformat)
+    args = parser.parse_args()
+
+    run_drift_job(args.date)
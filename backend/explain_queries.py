@@ -0,0 +1,260 @@
+"""
+Query plan check for the API and job access paths.
+
+Optionally seeds the configured database with a synthetic catalog,
+then EXPLAINs every hot query and exits non-zero if any of them
+plans a sequential (full table) scan. Supports PostgreSQL and
+SQLite.
+
+    DATABASE_URL=... python -m backend.explain_queries --seed
+"""
+
+import argparse
+import random
+import sys
+from datetime import date, timedelta
+
+from sqlalchemy import delete, func, insert, select, text
+
+from backend.common.database import Base, engine
+from backend.common.models import Alert, FeatureSnapshot, PricingDecision
+from backend.fastapi_service.routers.skus import _latest_decisions_query
+from backend.kpi_job import _kpi_query
+from backend.pricing_inputs import PRICING_INPUT_COLUMNS
+from backend.pricing_runner import ML_STRATEGY
+
+PROBE_SKU = "SKU_00042"
+PROBE_DATE = date(2024, 3, 1)
+
+
+def hot_queries():
+    """
+    The statements issued by the routers and jobs, keyed by caller.
+    """
+    decisions = PricingDecision
+    snapshots = FeatureSnapshot
+
+    return {
+        "skus.latest_decision": (
+            select(decisions)
+            .where(decisions.product_id == PROBE_SKU)
+            .order_by(decisions.decision_date.desc(), decisions.id.desc())
+            .limit(1)
+        ),
+        "skus.history": (
+            select(decisions.decision_date, decisions.final_price, decisions.id)
+            .where(decisions.product_id == PROBE_SKU)
+            .where(decisions.decision_date >= PROBE_DATE - timedelta(days=30))
+            .order_by(decisions.decision_date.asc(), decisions.id.asc())
+            .limit(1001)
+        ),
+        "skus.bulk_latest_by_ids": _latest_decisions_query(
+            [PROBE_SKU, "SKU_00007"], None, False
+        ),
+        "skus.bulk_latest_by_category": _latest_decisions_query(
+            None, "grocery", False
+        ),
+        "response_cache.generation": (
+            select(decisions.id, decisions.created_at)
+            .where(
+                decisions.id
+                == select(func.max(decisions.id)).scalar_subquery()
+            )
+        ),
+        "alerts.active": (
+            select(Alert)
+            .where(Alert.status == "active")
+            .order_by(Alert.severity.desc(), Alert.first_seen.asc())
+        ),
+        "pricing_inputs.product_ids": (
+            select(snapshots.product_id)
+            .where(snapshots.snapshot_date == PROBE_DATE)
+            .order_by(snapshots.product_id)
+        ),
+        "pricing_inputs.batches": (
+            select(*PRICING_INPUT_COLUMNS)
+            .where(snapshots.snapshot_date == PROBE_DATE)
+            .order_by(snapshots.product_id)
+        ),
+        "pricing_inputs.shard": (
+            select(*PRICING_INPUT_COLUMNS)
+            .where(
+                snapshots.snapshot_date == PROBE_DATE,
+                snapshots.product_id.between("SKU_00000", PROBE_SKU),
+            )
+            .order_by(snapshots.product_id)
+        ),
+        "pricing_shards.reconcile": (
+            select(decisions.product_id, func.count())
+            .where(
+                decisions.decision_date == PROBE_DATE,
+                decisions.strategy == ML_STRATEGY,
+            )
+            .group_by(decisions.product_id)
+        ),
+        "kpi_job.rollup": _kpi_query(PROBE_DATE),
+        "feature_job.replace": (
+            delete(FeatureSnapshot.__table__)
+            .where(FeatureSnapshot.snapshot_date == PROBE_DATE)
+        ),
+    }
+
+
+# -----------------------------
+# Seeding
+# -----------------------------
+def seed(n_skus, n_days, chunk_size=5000):
+    """
+    Insert a synthetic catalog; skipped if the tables already hold
+    rows (a previous seed, or real data that must not be touched).
+    """
+    Base.metadata.create_all(engine)
+
+    seeded = [PricingDecision, FeatureSnapshot, Alert]
+
+    with engine.connect() as conn:
+        if any(
+            conn.execute(select(model.id).limit(1)).first() is not None
+            for model in seeded
+        ):
+            print("Tables already hold rows; skipping seed")
+            return
+
+    rng = random.Random(7)
+    start = PROBE_DATE - timedelta(days=n_days - 1)
+    product_ids = [f"SKU_{i:05d}" for i in range(n_skus)]
+
+    def decision_rows():
+        for d in range(n_days):
+            day = start + timedelta(days=d)
+            for product_id in product_ids:
+                price = round(rng.uniform(20, 300), 2)
+                yield {
+                    "decision_date": day,
+                    "product_id": product_id,
+                    "strategy": "ml",
+                    "prev_price": price,
+                    "final_price": price,
+                    "price_change_pct": 0.0,
+                    "cost_price": round(price * 0.6, 2),
+                    "min_margin_pct": 0.15,
+                    "margin_ok": True,
+                    "decision_reason": "revenue_maximization",
+                    "explainability": None,
+                }
+
+    def snapshot_rows():
+        for d in range(n_days):
+            day = start + timedelta(days=d)
+            for product_id in product_ids:
+                yield {
+                    "snapshot_date": day,
+                    "product_id": product_id,
+                    "prev_price": 100.0,
+                    "cost_price": 60.0,
+                    "min_margin_pct": 0.15,
+                    "predicted_demand": 10.0,
+                    "inventory": 300,
+                    "sales_roll_mean_7": 10.0,
+                    "clearance_days": 45,
+                    "category": "grocery",
+                }
+
+    def alert_rows():
+        for i in range(n_skus * 5):
+            yield {
+                "alert_type": "input_drift",
+                "severity": rng.choice(["warning", "critical"]),
+                "message": "PSI exceeded threshold",
+                "status": "active" if i % 100 == 0 else "resolved",
+                "first_seen": start,
+                "last_seen": start,
+            }
+
+    with engine.connect() as conn:
+        for table, rows in [
+            (PricingDecision.__table__, decision_rows()),
+            (FeatureSnapshot.__table__, snapshot_rows()),
+            (Alert.__table__, alert_rows()),
+        ]:
+            chunk = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) == chunk_size:
+                    conn.execute(insert(table), chunk)
+                    chunk = []
+            if chunk:
+                conn.execute(insert(table), chunk)
+            conn.commit()
+
+        conn.execute(text("ANALYZE"))
+        conn.commit()
+
+
+# -----------------------------
+# Plan checks
+# -----------------------------
+def explain(conn, stmt):
+    sql = str(stmt.compile(engine, compile_kwargs={"literal_binds": True}))
+
+    if engine.dialect.name == "sqlite":
+        return [row[-1] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+    return [row[0] for row in conn.execute(text(f"EXPLAIN {sql}"))]
+
+
+def is_sequential(plan_line):
+    line = plan_line.strip().lstrip("->").strip()
+
+    if engine.dialect.name == "sqlite":
+        # "SCAN <table>"; scans of subqueries / co-routines are fine
+        words = line.split()
+        return (
+            len(words) >= 2
+            and words[0] == "SCAN"
+            and words[1] in Base.metadata.tables
+            and "INDEX" not in line
+        )
+
+    return line.startswith("Seq Scan")
+
+
+def check_plans(verbose=False):
+    failures = []
+
+    with engine.connect() as conn:
+        for name, stmt in hot_queries().items():
+            plan = explain(conn, stmt)
+            seq = [line for line in plan if is_sequential(line)]
+
+            status = "SEQ SCAN" if seq else "ok"
+            print(f"{name:<28} {status}")
+
+            if verbose or seq:
+                for line in plan:
+                    print(f"    {line}")
+
+            if seq:
+                failures.append(name)
+
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seed", action="store_true", help="Seed synthetic rows first")
+    parser.add_argument("--skus", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--verbose", action="store_true", help="Print every plan")
+    args = parser.parse_args()
+
+    if args.seed:
+        seed(args.skus, args.days)
+
+    failures = check_plans(verbose=args.verbose)
+
+    if failures:
+        print(f"Sequential scans in: {', '.join(failures)}")
+        sys.exit(1)
+
+    print("All hot queries use indexes")
@@ -0,0 +1,73 @@
+"""
+Server-side downsampling of (date, price) series for charts.
+"""
+
+from datetime import timedelta
+from itertools import groupby
+
+import numpy as np
+
+
+def _bucket_start(day, period):
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    return day.replace(day=1)
+
+
+def ohlc(rows, period):
+    """
+    Collapse date-ordered (date, price) rows into one open/high/
+    low/close bar per calendar week (starting Monday) or month.
+    """
+    bars = []
+
+    for start, bucket in groupby(rows, key=lambda r: _bucket_start(r[0], period)):
+        prices = [price for _, price in bucket]
+        bars.append({
+            "date": start.isoformat(),
+            "open": prices[0],
+            "high": max(prices),
+            "low": min(prices),
+            "close": prices[-1],
+        })
+
+    return bars
+
+
+def lttb(rows, n_points):
+    """
+    Largest-Triangle-Three-Buckets: keep n_points of the date-ordered
+    (date, price) rows that best preserve the visual shape of the
+    line. Always keeps the first and last points.
+    """
+    if n_points >= len(rows) or n_points < 3:
+        return list(rows)
+
+    x = np.array([r[0].toordinal() for r in rows], dtype=float)
+    y = np.array([r[1] for r in rows], dtype=float)
+
+    # Inner points split into n_points - 2 buckets
+    edges = np.linspace(1, len(rows) - 1, n_points - 1).astype(int)
+
+    keep = [0]
+    for i in range(n_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+
+        # Average of the next bucket (or the last point)
+        if i + 2 < len(edges):
+            next_lo, next_hi = edges[i + 1], edges[i + 2]
+        else:
+            next_lo, next_hi = len(rows) - 1, len(rows)
+        avg_x = x[next_lo:next_hi].mean()
+        avg_y = y[next_lo:next_hi].mean()
+
+        a = keep[-1]
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a])
+            - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        keep.append(lo + int(area.argmax()))
+
+    keep.append(len(rows) - 1)
+
+    return [rows[i] for i in keep]
@@ -1,12 +1,28 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from backend.common.database import dispose_async_engine
+from backend.common.overrides import start_override_listener
 from backend.fastapi_service.routers import health, alerts, skus
 from fastapi.middleware.cors import CORSMiddleware
 
+
+@asynccontextmanager
+async def lifespan(app):
+    # Push invalidation of the cached override state (PostgreSQL)
+    stop_listener = start_override_listener()
+    yield
+    if stop_listener is not None:
+        stop_listener.set()
+    await dispose_async_engine()
+
+
 app = FastAPI(
     title="Pricing System API",
     description="Read-only APIs for pricing monitoring and explainability",
     version="0.1.0",
+    lifespan=lifespan,
 )
 app.add_middleware(
     CORSMiddleware,
@@ -0,0 +1,136 @@
+"""
+Response cache for pricing decision endpoints.
+
+Decisions only change when a pricing run commits, so responses are
+cached in-process and keyed on the current decision generation:
+the id and timestamp of the newest pricing_decisions row. A new run
+inserts rows, which moves the generation and invalidates every
+cached response. The generation itself is probed at most once per
+DECISION_GENERATION_POLL_SECONDS (a primary-key lookup).
+"""
+
+import hashlib
+import json
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from sqlalchemy import func, select
+
+from backend.common.cache import TTLCache
+from backend.common.config import settings
+from backend.common.models import PricingDecision
+
+_responses = TTLCache(
+    maxsize=settings.SKU_CACHE_MAX_ENTRIES,
+    ttl=settings.SKU_CACHE_TTL_SECONDS,
+)
+_generation = TTLCache(maxsize=1, ttl=settings.DECISION_GENERATION_POLL_SECONDS)
+_last_generation_id = None
+
+
+async def decision_generation(db):
+    """
+    (id, created_at) of the newest decision, or (0, None) if none.
+    """
+    global _last_generation_id
+
+    generation = _generation.get("current")
+
+    if generation is None:
+        result = await db.execute(
+            select(PricingDecision.id, PricingDecision.created_at)
+            .where(
+                PricingDecision.id
+                == select(func.max(PricingDecision.id)).scalar_subquery()
+            )
+        )
+        row = result.first()
+
+        generation = (row.id, _as_utc(row.created_at)) if row else (0, None)
+
+        # A run landed: entries for the old generation are dead weight
+        if generation[0] != _last_generation_id:
+            _responses.clear()
+            _last_generation_id = generation[0]
+
+        _generation.set("current", generation)
+
+    return generation
+
+
+def invalidate_decision_cache():
+    """
+    Drop all cached responses and force a fresh generation probe.
+    """
+    _responses.clear()
+    _generation.clear()
+
+
+def _as_utc(ts):
+    if ts is None:
+        return None
+    if ts.tzinfo is None:
+        return ts.replace(tzinfo=timezone.utc)
+    return ts.astimezone(timezone.utc)
+
+
+def _not_modified(request, etag, last_modified):
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match is not None:
+        return etag in [tag.strip() for tag in if_none_match.split(",")]
+
+    if_modified_since = request.headers.get("if-modified-since")
+
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+async def cached_response(request, db, build, extra_headers=None):
+    """
+    Serve await build(db)'s payload for this URL from the cache, honouring
+    If-None-Match / If-Modified-Since. extra_headers(payload), if
+    given, adds headers derived from the payload (e.g. Link).
+    """
+    generation_id, generated_at = await decision_generation(db)
+    key = (str(request.url.path), str(request.url.query))
+
+    entry = _responses.get(key)
+
+    if entry is None or entry[0] != generation_id:
+        payload = await build(db)
+        content = jsonable_encoder(payload)
+        digest = hashlib.sha1(
+            json.dumps(content, sort_keys=True).encode()
+        ).hexdigest()
+
+        entry = (
+            generation_id,
+            content,
+            f'W/"{generation_id}-{digest[:16]}"',
+            extra_headers(payload) if extra_headers else {},
+        )
+        _responses.set(key, entry)
+
+    _, content, etag, entry_headers = entry
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        **entry_headers,
+    }
+    if generated_at is not None:
+        headers["Last-Modified"] = format_datetime(generated_at, usegmt=True)
+
+    if _not_modified(request, etag, generated_at):
+        return Response(status_code=304, headers=headers)
+
+    return JSONResponse(content=content, headers=headers)
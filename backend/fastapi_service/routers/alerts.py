@@ -1,20 +1,21 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.common.database import get_db
+from backend.common.database import get_async_db
 from backend.common.models import Alert
 
 router = APIRouter()
 
 
 @router.get("/")
-def list_active_alerts(db: Session = Depends(get_db)):
-    alerts = (
-        db.query(Alert)
-        .filter(Alert.status == "active")
+async def list_active_alerts(db: AsyncSession = Depends(get_async_db)):
+    result = await db.execute(
+        select(Alert)
+        .where(Alert.status == "active")
         .order_by(Alert.severity.desc(), Alert.first_seen.asc())
-        .all()
     )
+    alerts = result.scalars().all()
 
     return [
         {
@@ -1,28 +1,81 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from backend.common.overrides import get_active_overrides
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from backend.common.overrides import get_active_overrides_async
 
-from backend.common.database import get_db
+from backend.common.database import get_async_db
+from backend.common.models import Alert, DailyKPI
 
 router = APIRouter()
 
+# Trailing window for the revenue baseline (monitoring_spec.md §4)
+KPI_BASELINE_DAYS = 30
+
 
 @router.get("/summary")
-def system_health_summary(db: Session = Depends(get_db)):
-    # Simple sanity query
-    db.execute(text("SELECT 1"))
+async def system_health_summary(db: AsyncSession = Depends(get_async_db)):
+    """
+    Latest daily_kpis row, its revenue per SKU against the trailing
+    KPI_BASELINE_DAYS average, and the active alert count.
+    """
+    result = await db.execute(
+        select(DailyKPI)
+        .order_by(DailyKPI.date.desc())
+        .limit(KPI_BASELINE_DAYS + 1)
+    )
+    kpis = result.scalars().all()
 
-    return {
-        "active_strategy": "ml",
+    active_alerts = await db.scalar(
+        select(func.count())
+        .select_from(Alert)
+        .where(Alert.status == "active")
+    )
+
+    overrides = await get_active_overrides_async(db)
+
+    if "PRICE_FREEZE" in overrides:
+        active_strategy = "static"
+    elif "FORCE_RULE_BASED" in overrides:
+        active_strategy = "rule_based"
+    else:
+        active_strategy = "ml"
+
+    summary = {
+        "active_strategy": active_strategy,
+        "kpi_date": None,
+        "total_revenue": 0.0,
+        "revenue_per_sku": 0.0,
         "revenue_delta_pct": 0.0,
         "stockout_rate": 0.0,
-        "active_alerts": 0,
+        "clearance_misses": 0,
+        "active_alerts": active_alerts,
     }
 
+    if not kpis:
+        return summary
+
+    latest, baseline = kpis[0], kpis[1:]
+
+    summary.update({
+        "kpi_date": latest.date,
+        "total_revenue": float(latest.total_revenue),
+        "revenue_per_sku": float(latest.revenue_per_sku),
+        "stockout_rate": float(latest.stockout_rate),
+        "clearance_misses": latest.clearance_misses,
+    })
+
+    if baseline:
+        base = sum(float(k.revenue_per_sku) for k in baseline) / len(baseline)
+        if base:
+            summary["revenue_delta_pct"] = round(
+                (float(latest.revenue_per_sku) - base) / base * 100, 2
+            )
+
+    return summary
+
 @router.get("/status")
-def system_status():
-    overrides = get_active_overrides()
+async def system_status(db: AsyncSession = Depends(get_async_db)):
+    overrides = await get_active_overrides_async(db)
 
     if "PRICE_FREEZE" in overrides:
         return {
@@ -1,47 +1,242 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+import json
+from datetime import date
+from typing import List, Literal, Optional
 
-from backend.common.database import get_db
-from backend.common.models import PricingDecision
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.common.database import get_async_db, get_async_engine
+from backend.common.models import FeatureSnapshot, PricingDecision
+from backend.fastapi_service.downsample import lttb, ohlc
+from backend.fastapi_service.response_cache import cached_response
 
 router = APIRouter()
 
+HISTORY_PAGE_SIZE = 1000
+HISTORY_MAX_PAGE_SIZE = 5000
+BULK_FETCH_SIZE = 1000
+# product_ids become one bind variable each; larger requests get a 422
+# (query by category for whole segments instead)
+BULK_MAX_PRODUCT_IDS = 1000
 
-@router.get("/{product_id}/latest-decision")
-def latest_pricing_decision(product_id: str, db: Session = Depends(get_db)):
-    decision = (
-        db.query(PricingDecision)
-        .filter(PricingDecision.product_id == product_id)
-        .order_by(PricingDecision.decision_date.desc())
-        .first()
+
+class LatestDecisionsRequest(BaseModel):
+    product_ids: Optional[List[str]] = Field(
+        default=None, max_length=BULK_MAX_PRODUCT_IDS
     )
+    category: Optional[str] = None
+    include_explainability: bool = False
 
-    if not decision:
-        return {"message": "No pricing decision found"}
 
-    return {
-        "product_id": product_id,
-        "decision_date": decision.decision_date,
-        "strategy": decision.strategy,
-        "prev_price": decision.prev_price,
-        "final_price": decision.final_price,
-        "reason": decision.decision_reason,
-        "explainability": decision.explainability,
-    }
+def _latest_decisions_query(product_ids, category, include_explainability):
+    """
+    Latest decision per SKU in one statement: rank each SKU's rows by
+    date (newest first, ties to the newest row) and keep rank 1.
+    """
+    columns = [
+        PricingDecision.product_id,
+        PricingDecision.decision_date,
+        PricingDecision.strategy,
+        PricingDecision.prev_price,
+        PricingDecision.final_price,
+        PricingDecision.decision_reason.label("reason"),
+    ]
+    if include_explainability:
+        columns.append(PricingDecision.explainability)
 
-@router.get("/{product_id}/history")
-def pricing_history(product_id: str, db: Session = Depends(get_db)):
-    rows = (
-        db.query(PricingDecision)
-        .filter(PricingDecision.product_id == product_id)
-        .order_by(PricingDecision.decision_date.asc())
-        .all()
+    ranked = select(
+        *columns,
+        func.row_number().over(
+            partition_by=PricingDecision.product_id,
+            order_by=(
+                PricingDecision.decision_date.desc(),
+                PricingDecision.id.desc(),
+            ),
+        ).label("rank"),
     )
 
-    return [
-        {
-            "date": r.decision_date.isoformat(),
-            "price": float(r.final_price),
+    if product_ids is not None:
+        ranked = ranked.where(PricingDecision.product_id.in_(product_ids))
+
+    if category is not None:
+        # Category membership comes from the latest feature snapshot
+        latest_snapshot = select(func.max(FeatureSnapshot.snapshot_date))
+        ranked = ranked.where(
+            PricingDecision.product_id.in_(
+                select(FeatureSnapshot.product_id)
+                .where(FeatureSnapshot.snapshot_date == latest_snapshot.scalar_subquery())
+                .where(FeatureSnapshot.category == category)
+            )
+        )
+
+    ranked = ranked.subquery()
+
+    return (
+        select(*[c for c in ranked.c if c.name != "rank"])
+        .where(ranked.c.rank == 1)
+        .order_by(ranked.c.product_id)
+    )
+
+
+@router.post("/latest-decisions")
+async def bulk_latest_decisions(body: LatestDecisionsRequest):
+    """
+    Latest decision for many SKUs (by product_ids and/or category),
+    streamed as NDJSON: one JSON object per line, ordered by SKU.
+    SKUs without any decision are omitted.
+    """
+    if body.product_ids is None and body.category is None:
+        raise HTTPException(
+            status_code=422,
+            detail="Provide product_ids and/or category",
+        )
+
+    stmt = _latest_decisions_query(
+        body.product_ids, body.category, body.include_explainability
+    )
+
+    async def stream():
+        async with get_async_engine().connect() as conn:
+            result = await conn.stream(stmt)
+
+            async for rows in result.partitions(BULK_FETCH_SIZE):
+                yield "".join(
+                    json.dumps(jsonable_encoder(row._asdict())) + "\n"
+                    for row in rows
+                )
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.get("/{product_id}/latest-decision")
+async def latest_pricing_decision(
+    product_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+):
+    async def build(db):
+        result = await db.execute(
+            select(PricingDecision)
+            .where(PricingDecision.product_id == product_id)
+            .order_by(
+                PricingDecision.decision_date.desc(),
+                PricingDecision.id.desc(),
+            )
+            .limit(1)
+        )
+        decision = result.scalars().first()
+
+        if not decision:
+            return {"message": "No pricing decision found"}
+
+        return {
+            "product_id": product_id,
+            "decision_date": decision.decision_date,
+            "strategy": decision.strategy,
+            "prev_price": decision.prev_price,
+            "final_price": decision.final_price,
+            "reason": decision.decision_reason,
+            "explainability": decision.explainability,
         }
-        for r in rows
-    ]
+
+    return await cached_response(request, db, build)
+
+def _parse_history_cursor(cursor):
+    """
+    "<decision_date>:<id>" of the last row of the previous page.
+    """
+    try:
+        day, decision_id = cursor.split(":")
+        return date.fromisoformat(day), int(decision_id)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+
+
+@router.get("/{product_id}/history")
+async def pricing_history(
+    product_id: str,
+    request: Request,
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    cursor: Optional[str] = None,
+    limit: int = Query(HISTORY_PAGE_SIZE, ge=1, le=HISTORY_MAX_PAGE_SIZE),
+    resample: Optional[Literal["week", "month"]] = None,
+    points: Optional[int] = Query(None, ge=3, le=HISTORY_MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Final price per decision date, optionally within [from, to].
+
+    Raw history is paged: up to `limit` rows after `cursor`, with a
+    Link rel="next" header while more remain. Reruns can log several
+    decisions on one date, so pages are keyed on (date, id). With `resample`
+    (weekly/monthly OHLC bars) or `points` (LTTB) the whole range is
+    downsampled server-side in one response instead.
+    """
+    downsampled = resample is not None or points is not None
+    after = _parse_history_cursor(cursor) if cursor is not None else None
+    next_cursor = None
+
+    async def build(db):
+        nonlocal next_cursor
+
+        query = (
+            select(
+                PricingDecision.decision_date,
+                PricingDecision.final_price,
+                PricingDecision.id,
+            )
+            .where(PricingDecision.product_id == product_id)
+            .order_by(
+                PricingDecision.decision_date.asc(),
+                PricingDecision.id.asc(),
+            )
+        )
+
+        if date_from is not None:
+            query = query.where(PricingDecision.decision_date >= date_from)
+        if date_to is not None:
+            query = query.where(PricingDecision.decision_date <= date_to)
+
+        if not downsampled:
+            if after is not None:
+                after_date, after_id = after
+                query = query.where(
+                    (PricingDecision.decision_date > after_date)
+                    | (
+                        (PricingDecision.decision_date == after_date)
+                        & (PricingDecision.id > after_id)
+                    )
+                )
+            # One extra row tells us whether another page exists
+            query = query.limit(limit + 1)
+
+        result = (await db.execute(query)).all()
+
+        if not downsampled and len(result) > limit:
+            result = result[:limit]
+            last_date, _, last_id = result[-1]
+            next_cursor = f"{last_date.isoformat()}:{last_id}"
+
+        rows = [(d, float(p)) for d, p, _ in result]
+
+        if resample is not None:
+            return ohlc(rows, resample)
+
+        if points is not None:
+            rows = lttb(rows, points)
+
+        return [{"date": d.isoformat(), "price": p} for d, p in rows]
+
+    def next_link(payload):
+        if next_cursor is None:
+            return {}
+
+        next_url = request.url.include_query_params(cursor=next_cursor)
+        return {"Link": f'<{next_url}>; rel="next"'}
+
+    return await cached_response(request, db, build, extra_headers=next_link)
@@ -5,57 +5,101 @@ Computes pricing features and stores them
 for deterministic pricing execution.
 """
 
-from datetime import date
+from datetime import date, timedelta
 
-from backend.common.database import SessionLocal
+import pandas as pd
+from sqlalchemy import delete, insert
+
+from backend.common.database import engine
+from backend.common.model_registry import predict_demand
 from backend.common.models import FeatureSnapshot
+from Scripts.build_features import (
+    STATE_DAYS,
+    build_daily_frame,
+    build_feature_frame,
+    load_raw,
+)
+
+
+def compute_feature_snapshots(run_date):
+    """
+    Compute one snapshot row per SKU for pricing run_date.
+
+    Runs the offline feature pipeline once over the trailing
+    STATE_DAYS of raw data, so every SKU is handled in a single
+    vectorized pass and the serving features match training, then
+    scores the active demand model on the day's feature matrix.
+    """
+
+    run_day = pd.Timestamp(run_date)
+
+    products, prices, sales, inventory, promos, calendar = load_raw(
+        filters=[
+            ("date", ">=", run_day - timedelta(days=STATE_DAYS)),
+            ("date", "<", run_day),
+        ]
+    )
+
+    # The day being priced has no facts yet; it only needs a row
+    # for its lag and rolling features to land on.
+    daily = pd.concat(
+        [
+            build_daily_frame(prices, sales, inventory),
+            products[["product_id"]].assign(date=run_day),
+        ],
+        ignore_index=True,
+    )
+
+    features = build_feature_frame(daily, products, promos, calendar)
+    features = features[features["date"] == run_day]
+
+    # One batched predict over the whole day
+    predicted = predict_demand(features)
+
+    if predicted is None:
+        print("No demand model registered; using 7-day average sales")
+        predicted = features["sales_roll_mean_7"]
+
+    return pd.DataFrame({
+        "snapshot_date": run_date,
+        "product_id": features["product_id"],
+        "prev_price": features["prev_price"],
+        "cost_price": features["cost_price"],
+        "min_margin_pct": features["min_margin_pct"],
+        "predicted_demand": predicted,
+        "inventory": features["prev_inventory"].astype(int),
+        "sales_roll_mean_7": features["sales_roll_mean_7"],
+        "clearance_days": features["clearance_days"].astype(int),
+        "category": features["category"],
+    })
+
+
+def write_feature_snapshots(snapshots, run_date):
+    """
+    Replace run_date's snapshots in one transaction, so reruns for
+    the same date never leave duplicate rows.
+    """
+
+    table = FeatureSnapshot.__table__
+    rows = snapshots.to_dict("records")
+
+    with engine.begin() as conn:
+        conn.execute(delete(table).where(table.c.snapshot_date == run_date))
+
+        if rows:
+            conn.execute(insert(table), rows)
+
+    return len(rows)
 
 
 def run_feature_job(run_date=None):
     if run_date is None:
         run_date = date.today()
 
-    db = SessionLocal()
-
-    try:
-        # ---------------------------------------
-        # TEMP: mocked feature computation
-        # Replace with real joins later
-        # ---------------------------------------
-        rows = [
-            {
-                "product_id": "SKU_001",
-                "prev_price": 100.0,
-                "cost_price": 70.0,
-                "min_margin_pct": 0.15,
-                "predicted_demand": 22.0,
-                "inventory": 300,
-                "sales_roll_mean_7": 20.0,
-                "clearance_days": 30,
-                "category": "grocery",
-            }
-        ]
+    snapshots = compute_feature_snapshots(run_date)
+    written = write_feature_snapshots(snapshots, run_date)
 
-        for r in rows:
-            snapshot = FeatureSnapshot(
-                snapshot_date=run_date,
-                product_id=r["product_id"],
-                prev_price=r["prev_price"],
-                cost_price=r["cost_price"],
-                min_margin_pct=r["min_margin_pct"],
-                predicted_demand=r["predicted_demand"],
-                inventory=r["inventory"],
-                sales_roll_mean_7=r["sales_roll_mean_7"],
-                clearance_days=r["clearance_days"],
-                category=r["category"],
-            )
-            db.add(snapshot)
-
-        db.commit()
-        print(f"Feature snapshots created for {run_date}")
-
-    finally:
-        db.close()
+    print(f"Feature snapshots created for {run_date} ({written} SKUs)")
 
 
 if __name__ == "__main__":
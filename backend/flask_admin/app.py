@@ -1,25 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
-from flask import Flask, render_template, request
+from flask import Flask, g, render_template, request
+from requests.adapters import HTTPAdapter
 
+from backend.common.cache import TTLCache
+from backend.common.config import settings
 from backend.flask_admin.routes.overrides import overrides_bp
 from backend.flask_admin.routes.retraining import retraining_bp
 
 
 FASTAPI_BASE = "http://127.0.0.1:8000"
 
+# --------------------------------
+# Upstream HTTP client
+# --------------------------------
+# One keep-alive connection pool shared by all request threads
+http = requests.Session()
+http.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.FLASK_HTTP_POOL_SIZE,
+    ),
+)
+
+# Runs a page's independent upstream calls side by side
+_fetch_pool = ThreadPoolExecutor(
+    max_workers=settings.FLASK_HTTP_POOL_SIZE,
+    thread_name_prefix="fastapi-fetch",
+)
+
+_status_cache = TTLCache(maxsize=1, ttl=settings.FLASK_STATUS_CACHE_SECONDS)
+
+
+def _get_json(path):
+    """
+    GET a FastAPI path; None if it is unreachable or errors.
+    """
+    try:
+        resp = http.get(f"{FASTAPI_BASE}{path}", timeout=2)
+        return resp.json()
+    except Exception:
+        return None
+
 
 def fetch_system_status():
     """
     Fetch global pricing system state from FastAPI.
     Injected into all templates via context processor.
+    Cached for FLASK_STATUS_CACHE_SECONDS across requests.
     """
-    try:
-        return requests.get(
-            f"{FASTAPI_BASE}/health/status",
-            timeout=2
-        ).json()
-    except Exception:
-        return None
+    status = _status_cache.get("status")
+
+    if status is None:
+        status = _get_json("/health/status")
+        if status is not None:
+            _status_cache.set("status", status)
+
+    return status
+
+
+def fetch_page_data(**paths):
+    """
+    Fetch a page's upstream JSON concurrently with the system status,
+    so a render costs one round-trip. Returns {name: json or None}.
+    """
+    futures = {
+        name: _fetch_pool.submit(_get_json, path)
+        for name, path in paths.items()
+    }
+    status = _fetch_pool.submit(fetch_system_status)
+
+    g.system_status = status.result()
+
+    return {name: future.result() for name, future in futures.items()}
 
 
 def create_app():
@@ -36,8 +91,11 @@ def create_app():
     # --------------------------------
     @app.context_processor
     def inject_global_state():
+        if "system_status" not in g:
+            g.system_status = fetch_system_status()
+
         return {
-            "system_status": fetch_system_status()
+            "system_status": g.system_status
         }
 
     # --------------------
@@ -45,12 +103,9 @@ def create_app():
     # --------------------
     @app.route("/")
     def health_page():
-        try:
-            health = requests.get(
-                f"{FASTAPI_BASE}/health/summary",
-                timeout=2
-            ).json()
-        except Exception:
+        health = fetch_page_data(health="/health/summary")["health"]
+
+        if health is None:
             health = {
                 "active_strategy": "unknown",
                 "revenue_delta_pct": "-",
@@ -62,13 +117,7 @@ def create_app():
 
     @app.route("/alerts")
     def alerts_page():
-        try:
-            alerts = requests.get(
-                f"{FASTAPI_BASE}/alerts",
-                timeout=2
-            ).json()
-        except Exception:
-            alerts = []
+        alerts = fetch_page_data(alerts="/alerts/")["alerts"] or []
 
         return render_template("alerts.html", alerts=alerts)
 
@@ -79,19 +128,16 @@ def create_app():
         error = None
 
         if sku:
-            try:
-                resp = requests.get(
-                    f"{FASTAPI_BASE}/skus/{sku}/latest-decision",
-                    timeout=2
-                )
-                data = resp.json()
-
-                if "message" in data:
-                    error = data["message"]
-                else:
-                    decision = data
-            except Exception:
+            data = fetch_page_data(
+                decision=f"/skus/{sku}/latest-decision"
+            )["decision"]
+
+            if data is None:
                 error = "FastAPI not reachable"
+            elif "message" in data:
+                error = data["message"]
+            else:
+                decision = data
 
         return render_template(
             "sku.html",
@@ -108,7 +154,7 @@ def create_app():
     def admin_freeze():
         reason = request.form.get("reason", "UI freeze")
 
-        resp = requests.post(
+        resp = http.post(
             f"{FASTAPI_BASE}/admin/overrides/freeze",
             json={
                 "reason": reason,
@@ -117,16 +163,18 @@ def create_app():
         )
 
         message = resp.json().get("message", "Freeze request sent")
+        _status_cache.clear()
 
         return render_template("admin.html", message=message)
 
     @app.route("/admin/unfreeze", methods=["POST"])
     def admin_unfreeze():
-        resp = requests.post(
+        resp = http.post(
             f"{FASTAPI_BASE}/admin/overrides/unfreeze"
         )
 
         message = resp.json().get("message", "Unfreeze request sent")
+        _status_cache.clear()
 
         return render_template("admin.html", message=message)
 
@@ -3,6 +3,7 @@ from datetime import datetime
 
 from backend.common.database import SessionLocal
 from backend.common.models import ManualOverride
+from backend.common.overrides import notify_overrides_changed
 
 overrides_bp = Blueprint("overrides", __name__)
 
@@ -27,6 +28,7 @@ def freeze_pricing():
             active=True,
         )
         db.add(override)
+        notify_overrides_changed(db)
         db.commit()
 
         return jsonify({
@@ -52,6 +54,7 @@ def unfreeze_pricing():
             .update({ManualOverride.active: False})
         )
 
+        notify_overrides_changed(db)
         db.commit()
 
         return jsonify({
@@ -28,7 +28,7 @@ document.addEventListener("DOMContentLoaded", () => {
   const sku = new URLSearchParams(window.location.search).get("sku");
   if (!sku) return;
 
-  fetch(`http://127.0.0.1:8000/skus/${sku}/history`)
+  fetch(`http://127.0.0.1:8000/skus/${sku}/history?points=365`)
     .then(res => {
       if (!res.ok) throw new Error("Failed to load price history");
       return res.json();
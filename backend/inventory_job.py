@@ -0,0 +1,118 @@
+"""
+Daily inventory monitoring job.
+
+Turns one day's inventory snapshot and realized sales into
+inventory_monitoring rows (opening / closing stock, stock-out flag,
+days of stock) for every SKU, using the offline simulation's outcome
+definitions so online KPIs match the evaluation numbers.
+"""
+
+import argparse
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import delete
+
+from backend.common.database import bulk_insert, engine
+from backend.common.models import InventoryMonitoring
+from Scripts.build_features import RAW_DIR
+from Scripts.simulation.metrics import inventory_outcomes
+from Scripts.storage import read_dataset
+
+# Trailing window for average daily sales (matches sales_roll_mean_7)
+DEMAND_WINDOW_DAYS = 7
+
+
+def compute_inventory_monitoring(run_date):
+    """
+    One row per SKU with both a snapshot and sales for run_date.
+
+    The snapshot is start-of-day stock, so it is the opening
+    inventory; days of stock divide the closing inventory by the
+    average daily sales over the DEMAND_WINDOW_DAYS ending run_date.
+    """
+    day = pd.Timestamp(run_date)
+
+    inventory = read_dataset(
+        RAW_DIR,
+        "inventory_snapshot",
+        columns=["date", "product_id", "on_hand_qty"],
+        filters=[("date", "==", day)],
+    )
+    sales = read_dataset(
+        RAW_DIR,
+        "daily_sales",
+        columns=["date", "product_id", "units_sold"],
+        filters=[
+            ("date", ">", day - timedelta(days=DEMAND_WINDOW_DAYS)),
+            ("date", "<=", day),
+        ],
+    )
+
+    avg_sales = sales.groupby("product_id")["units_sold"].mean()
+
+    df = inventory.merge(
+        sales.loc[sales["date"] == day, ["product_id", "units_sold"]],
+        on="product_id",
+        how="inner",
+    )
+
+    outcomes = inventory_outcomes(
+        df["on_hand_qty"].to_numpy(),
+        df["units_sold"].to_numpy(),
+        avg_sales.reindex(df["product_id"]).to_numpy(),
+    )
+
+    return pd.DataFrame({
+        "date": run_date,
+        "product_id": df["product_id"].to_numpy(),
+        "opening_inventory": df["on_hand_qty"].to_numpy(dtype=np.int64),
+        "units_sold": df["units_sold"].to_numpy(dtype=np.int64),
+        "closing_inventory": outcomes["closing_inventory"].astype(np.int64),
+        "stockout_flag": outcomes["stockout"],
+        "days_of_stock": outcomes["days_of_stock"].round(2),
+    })
+
+
+def write_inventory_monitoring(rows, run_date):
+    """
+    Replace run_date's rows in one transaction, so reruns are
+    idempotent.
+    """
+    table = InventoryMonitoring.__table__
+
+    with engine.begin() as conn:
+        conn.execute(delete(table).where(table.c.date == run_date))
+        return bulk_insert(conn, table, rows)
+
+
+def run_inventory_monitoring(run_date=None):
+    """
+    Log run_date (default: yesterday, the last day with sales).
+    """
+    if run_date is None:
+        run_date = date.today() - timedelta(days=1)
+
+    rows = compute_inventory_monitoring(run_date)
+
+    if rows.empty:
+        print(f"No inventory snapshot with sales for {run_date}")
+        return None
+
+    written = write_inventory_monitoring(rows, run_date)
+
+    print(
+        f"Inventory outcomes logged for {run_date} ({written} SKUs, "
+        f"stockout rate {rows['stockout_flag'].mean():.4f})"
+    )
+
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Log daily inventory outcomes")
+    parser.add_argument("--date", type=date.fromisoformat)
+    args = parser.parse_args()
+
+    run_inventory_monitoring(args.date)
@@ -0,0 +1,160 @@
+"""
+Daily KPI rollup.
+
+Runs after pricing: aggregates one day's decisions and inventory
+outcomes into a single daily_kpis row, so /health/summary serves
+precomputed numbers instead of scanning pricing_decisions.
+"""
+
+import argparse
+from datetime import date, timedelta
+
+from sqlalchemy import case, delete, func, insert, select
+
+from backend.common.database import engine
+from backend.common.models import (
+    DailyKPI,
+    FeatureSnapshot,
+    InventoryMonitoring,
+    PricingDecision,
+)
+
+
+def _kpi_query(kpi_date):
+    """
+    One aggregate over kpi_date's SKUs, using the day's last decision
+    per SKU (reruns append rows). Definitions follow the offline
+    metrics: revenue = price x units sold, a stock-out is a SKU-day
+    that sold through its inventory, and a clearance miss is a SKU
+    left with more days of stock than its clearance window.
+    """
+    decision = PricingDecision
+    outcome = InventoryMonitoring
+    snapshot = FeatureSnapshot
+
+    latest = (
+        select(func.max(decision.id).label("id"))
+        .where(decision.decision_date == kpi_date)
+        .group_by(decision.product_id)
+        .subquery()
+    )
+
+    return (
+        select(
+            func.count(outcome.id).label("skus"),
+            func.sum(decision.final_price * outcome.units_sold).label("revenue"),
+            func.sum(case((outcome.stockout_flag, 1), else_=0)).label("stockouts"),
+            func.sum(
+                case(
+                    (
+                        (outcome.closing_inventory > 0)
+                        & (outcome.days_of_stock > snapshot.clearance_days),
+                        1,
+                    ),
+                    else_=0,
+                )
+            ).label("clearance_misses"),
+        )
+        .select_from(decision)
+        .join(latest, decision.id == latest.c.id)
+        .join(
+            outcome,
+            (outcome.date == decision.decision_date)
+            & (outcome.product_id == decision.product_id),
+        )
+        .outerjoin(
+            snapshot,
+            (snapshot.snapshot_date == decision.decision_date)
+            & (snapshot.product_id == decision.product_id),
+        )
+    )
+
+
+def compute_daily_kpis(kpi_date):
+    """
+    KPI row for kpi_date, or None if no outcomes are logged yet.
+    """
+    with engine.connect() as conn:
+        row = conn.execute(_kpi_query(kpi_date)).one()
+
+    if not row.skus:
+        return None
+
+    revenue = float(row.revenue or 0)
+
+    return {
+        "date": kpi_date,
+        "total_revenue": round(revenue, 2),
+        "revenue_per_sku": round(revenue / row.skus, 2),
+        "stockout_rate": round(row.stockouts / row.skus, 4),
+        "clearance_misses": int(row.clearance_misses),
+    }
+
+
+def write_daily_kpis(kpis):
+    """
+    Replace the KPI row for kpis["date"], so reruns are idempotent.
+    """
+    table = DailyKPI.__table__
+
+    with engine.begin() as conn:
+        conn.execute(delete(table).where(table.c.date == kpis["date"]))
+        conn.execute(insert(table), kpis)
+
+
+def run_kpi_rollup(kpi_date=None):
+    """
+    Roll up kpi_date (default: yesterday, the last complete day).
+    """
+    if kpi_date is None:
+        kpi_date = date.today() - timedelta(days=1)
+
+    kpis = compute_daily_kpis(kpi_date)
+
+    if kpis is None:
+        print(f"No inventory outcomes for {kpi_date}; KPIs not rolled up")
+        return None
+
+    write_daily_kpis(kpis)
+
+    print(
+        f"KPIs for {kpi_date}: revenue {kpis['total_revenue']}, "
+        f"stockout rate {kpis['stockout_rate']}, "
+        f"clearance misses {kpis['clearance_misses']}"
+    )
+
+    return kpis
+
+
+def backfill_daily_kpis():
+    """
+    Roll up every day that has outcomes but no KPI row yet.
+    """
+    pending = (
+        select(InventoryMonitoring.date)
+        .distinct()
+        .where(InventoryMonitoring.date.not_in(select(DailyKPI.date)))
+        .order_by(InventoryMonitoring.date)
+    )
+
+    with engine.connect() as conn:
+        days = conn.execute(pending).scalars().all()
+
+    for day in days:
+        run_kpi_rollup(day)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Roll up daily KPIs")
+    parser.add_argument("--date", type=date.fromisoformat)
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="Roll up all days with outcomes but no KPI row",
+    )
+    args = parser.parse_args()
+
+    if args.backfill:
+        backfill_daily_kpis()
+    else:
+        run_kpi_rollup(args.date)
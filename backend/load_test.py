@@ -0,0 +1,104 @@
+"""
+HTTP load test for the FastAPI service.
+
+Runs a fixed number of concurrent clients against a running API for
+a fixed duration, cycling through the dashboard's read endpoints, and
+reports throughput and latency percentiles.
+
+    python -m backend.load_test --base-url http://127.0.0.1:8000 \
+        --concurrency 64 --duration 20 --skus SKU_00001,SKU_00042
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+
+import httpx
+import numpy as np
+
+
+def default_paths(skus):
+    paths = ["/health/status", "/health/summary", "/alerts/"]
+
+    for sku in skus:
+        paths.append(f"/skus/{sku}/latest-decision")
+        paths.append(f"/skus/{sku}/history?points=365")
+
+    return paths
+
+
+async def _client(client, paths, deadline, latencies, errors):
+    for path in paths:
+        if time.perf_counter() >= deadline:
+            return
+
+        start = time.perf_counter()
+        try:
+            resp = await client.get(path)
+            if resp.status_code >= 400:
+                errors.append(resp.status_code)
+        except httpx.HTTPError as exc:
+            errors.append(type(exc).__name__)
+        latencies.append(time.perf_counter() - start)
+
+
+async def run_load(base_url, paths, concurrency, duration):
+    latencies = []
+    errors = []
+
+    limits = httpx.Limits(
+        max_connections=concurrency,
+        max_keepalive_connections=concurrency,
+    )
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=30
+    ) as client:
+        start = time.perf_counter()
+        deadline = start + duration
+
+        await asyncio.gather(*[
+            _client(
+                client,
+                itertools.islice(itertools.cycle(paths), i, None),
+                deadline,
+                latencies,
+                errors,
+            )
+            for i in range(concurrency)
+        ])
+
+        elapsed = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000
+
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "throughput_rps": len(latencies) / elapsed,
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p95_ms": float(np.percentile(ms, 95)),
+        "p99_ms": float(np.percentile(ms, 99)),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the pricing API")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument(
+        "--skus",
+        default="SKU_00001",
+        help="Comma-separated SKUs for the /skus endpoints",
+    )
+    args = parser.parse_args()
+
+    paths = default_paths(args.skus.split(","))
+    summary = asyncio.run(
+        run_load(args.base_url, paths, args.concurrency, args.duration)
+    )
+
+    for key, value in summary.items():
+        print(f"{key:<16} {value:,.1f}")
@@ -1,33 +1,109 @@
 from datetime import date
-from backend.common.database import SessionLocal
+
+import numpy as np
+from sqlalchemy import select
+
+from backend.common.config import settings
+from backend.common.database import engine
 from backend.common.models import FeatureSnapshot
 
 
-def load_pricing_inputs_for_date(run_date=None):
+# Columns the optimizer needs, in batch-dict key order
+PRICING_INPUT_COLUMNS = (
+    FeatureSnapshot.product_id,
+    FeatureSnapshot.prev_price,
+    FeatureSnapshot.cost_price,
+    FeatureSnapshot.min_margin_pct,
+    FeatureSnapshot.predicted_demand.label("predicted_units_sold"),
+    FeatureSnapshot.category,
+    FeatureSnapshot.inventory,
+    FeatureSnapshot.sales_roll_mean_7,
+    FeatureSnapshot.clearance_days,
+)
+
+NUMERIC_INPUT_COLUMNS = {
+    "prev_price",
+    "cost_price",
+    "min_margin_pct",
+    "predicted_units_sold",
+    "inventory",
+    "sales_roll_mean_7",
+    "clearance_days",
+}
+
+
+def _rows_to_columns(keys, rows):
+    columns = dict(zip(keys, zip(*rows)))
+
+    return {
+        key: (
+            np.asarray(values, dtype=np.float64)
+            if key in NUMERIC_INPUT_COLUMNS
+            else np.asarray(values, dtype=object)
+        )
+        for key, values in columns.items()
+    }
+
+
+def load_product_ids_for_date(run_date=None):
     if run_date is None:
         run_date = date.today()
 
-    db = SessionLocal()
-    try:
-        rows = (
-            db.query(FeatureSnapshot)
-            .filter(FeatureSnapshot.snapshot_date == run_date)
-            .all()
-        )
+    stmt = (
+        select(FeatureSnapshot.product_id)
+        .where(FeatureSnapshot.snapshot_date == run_date)
+        .order_by(FeatureSnapshot.product_id)
+    )
+
+    with engine.connect() as conn:
+        return conn.execute(stmt).scalars().all()
+
+
+def iter_pricing_input_batches(run_date=None, batch_size=None, product_range=None):
+    """
+    Stream the day's pricing inputs as columnar batches.
+
+    Selects only the optimizer columns and fetches them through a
+    server-side cursor, yielding dicts of NumPy arrays keyed like
+    PRICING_INPUT_COLUMNS. Pass product_range=(first, last) to
+    restrict the stream to the SKUs between those product_ids,
+    inclusive (e.g. one shard); it binds two values however many
+    SKUs the range holds.
+    """
+
+    if run_date is None:
+        run_date = date.today()
+
+    if batch_size is None:
+        batch_size = settings.PRICING_READ_BATCH_SIZE
+
+    stmt = (
+        select(*PRICING_INPUT_COLUMNS)
+        .where(FeatureSnapshot.snapshot_date == run_date)
+        .order_by(FeatureSnapshot.product_id)
+    )
+
+    if product_range is not None:
+        stmt = stmt.where(FeatureSnapshot.product_id.between(*product_range))
+
+    with engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True,
+            max_row_buffer=batch_size,
+        ).execute(stmt)
+
+        keys = list(result.keys())
+
+        if engine.dialect.supports_server_side_cursors:
+            partitions = result.partitions(batch_size)
+        else:
+            # e.g. SQLite: an open read cursor blocks the writer's
+            # commits, so buffer the projected tuples up front.
+            buffered = result.all()
+            partitions = (
+                buffered[i:i + batch_size]
+                for i in range(0, len(buffered), batch_size)
+            )
 
-        return [
-            {
-                "product_id": r.product_id,
-                "prev_price": r.prev_price,
-                "cost_price": r.cost_price,
-                "min_margin_pct": r.min_margin_pct,
-                "predicted_units_sold": r.predicted_demand,
-                "category": r.category,
-                "inventory": r.inventory,
-                "sales_roll_mean_7": r.sales_roll_mean_7,
-                "clearance_days": r.clearance_days,
-            }
-            for r in rows
-        ]
-    finally:
-        db.close()
+        for rows in partitions:
+            yield _rows_to_columns(keys, rows)
@@ -5,11 +5,15 @@ Executes pricing for a given date,
 enforcing manual overrides and writing decisions.
 """
 
-from datetime import date
+from datetime import date, timedelta
 
+from backend.common.config import settings
 from backend.common.overrides import get_active_overrides
-from backend.pricing_inputs import load_pricing_inputs_for_date
-from backend.pricing_runner import run_ml_pricing_for_day
+from backend.inventory_job import run_inventory_monitoring
+from backend.kpi_job import run_kpi_rollup
+from backend.pricing_inputs import iter_pricing_input_batches
+from backend.pricing_runner import clear_decisions, run_ml_pricing_for_batches
+from backend.pricing_shards import run_sharded_ml_pricing
 
 
 def run_static_pricing():
@@ -22,15 +26,36 @@ def run_rule_based_pricing():
     # TODO: heuristic pricing logic
 
 
-def run_pricing_job(run_date=None):
+def run_pricing_job(run_date=None, n_shards=None):
     """
     Executes pricing for a given date.
     If run_date is None, defaults to today.
+    With n_shards > 1 (default: PRICING_SHARDS), ML pricing runs
+    across a process pool, one product_id range of SKUs per task.
+    Afterwards logs inventory outcomes and rolls up KPIs for the
+    previous (last complete) day.
+
+    Decisions are committed chunk by chunk, so run_date's decision log
+    is only complete once the job finishes; ML pricing first clears
+    the day's earlier ML decisions, so rerunning a failed or finished
+    day leaves exactly one decision per SKU.
     """
     if run_date is None:
         run_date = date.today()
 
-    overrides = get_active_overrides()
+    if n_shards is None:
+        n_shards = settings.PRICING_SHARDS
+
+    _run_pricing(run_date, n_shards)
+
+    # Post-pricing stage
+    last_complete = run_date - timedelta(days=1)
+    run_inventory_monitoring(last_complete)
+    run_kpi_rollup(last_complete)
+
+
+def _run_pricing(run_date, n_shards):
+    overrides = get_active_overrides(use_cache=False)
 
     if "PRICE_FREEZE" in overrides:
         print("PRICE_FREEZE active → forcing static pricing")
@@ -44,13 +69,22 @@ def run_pricing_job(run_date=None):
 
     print(f"Running ML pricing for {run_date}")
 
-    pricing_inputs = load_pricing_inputs_for_date(run_date)
+    if n_shards > 1:
+        summary = run_sharded_ml_pricing(run_date, n_shards)
+    else:
+        clear_decisions(run_date)
+        batches = iter_pricing_input_batches(run_date)
+        summary = run_ml_pricing_for_batches(batches, decision_date=run_date)
 
-    if not pricing_inputs:
+    if not summary["rows_written"]:
         print("No pricing inputs found for date:", run_date)
         return
 
-    run_ml_pricing_for_day(pricing_inputs)
+    print(
+        f"Wrote {summary['rows_written']} decisions "
+        f"in {summary['chunks']} chunks "
+        f"({summary['elapsed_seconds']}s)"
+    )
 
 
 if __name__ == "__main__":
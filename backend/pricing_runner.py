@@ -1,54 +1,160 @@
+import time
 from datetime import date
+from itertools import islice
 
-from backend.common.database import SessionLocal
+import numpy as np
+from sqlalchemy import delete, insert
+
+from backend.common.config import settings
+from backend.common.database import engine
 from backend.common.models import PricingDecision
 
 # IMPORT YOUR REAL OPTIMIZER HERE
-from Scripts.pricing_optimizer import select_optimal_price
+from Scripts.pricing_optimizer import select_optimal_prices_batch
+
+# strategy column value of every decision this module writes
+ML_STRATEGY = "ml"
+
+
+def _iter_chunks(rows, chunk_size):
+    it = iter(rows)
 
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
 
-def run_ml_pricing_for_day(pricing_inputs):
+
+def clear_decisions(run_date, strategy=ML_STRATEGY):
     """
-    pricing_inputs: iterable of dicts, one per SKU
+    Delete run_date's decisions for strategy, so a rerun (e.g. after a
+    failure with some chunks or shards already committed) starts
+    clean. Other strategies' decisions for the day are kept.
     """
 
-    db = SessionLocal()
-    today = date.today()
-
-    try:
-        for row in pricing_inputs:
-            result = select_optimal_price(
-                prev_price=row["prev_price"],
-                cost_price=row["cost_price"],
-                base_demand=row["predicted_units_sold"],
-                category=row["category"],
-                inventory_lag_1=row["inventory"],
-                sales_roll_mean_7=row["sales_roll_mean_7"],
-                days_to_expiry=row["clearance_days"],
+    table = PricingDecision.__table__
+
+    with engine.begin() as conn:
+        return conn.execute(
+            delete(table).where(
+                table.c.decision_date == run_date,
+                table.c.strategy == strategy,
             )
+        ).rowcount
+
+
+def write_pricing_decisions(decisions, chunk_size=None):
+    """
+    Stream decision rows into pricing_decisions in chunks.
+
+    decisions: iterable of dicts keyed by PricingDecision column names.
+    Each chunk is written with one multi-row INSERT and committed
+    on its own, so memory stays bounded by the chunk size; callers
+    clear_decisions first so a rerun never appends to a partial day.
+    """
+
+    if chunk_size is None:
+        chunk_size = settings.PRICING_WRITE_CHUNK_SIZE
+
+    table = PricingDecision.__table__
+    rows_written = 0
+    chunks = 0
+    start = time.perf_counter()
+
+    with engine.connect() as conn:
+        for chunk in _iter_chunks(decisions, chunk_size):
+            conn.execute(insert(table).values(chunk))
+            conn.commit()
 
-            final_price = result["final_price"]
-
-            decision = PricingDecision(
-                decision_date=today,
-                product_id=row["product_id"],
-                strategy="ml",
-                prev_price=row["prev_price"],
-                final_price=final_price,
-                price_change_pct=(
-                    (final_price - row["prev_price"]) / row["prev_price"] * 100
-                    if row["prev_price"] > 0 else 0
-                ),
-                cost_price=row["cost_price"],
-                min_margin_pct=row["min_margin_pct"],
-                margin_ok=final_price >= row["cost_price"] * (1 + row["min_margin_pct"]),
-                decision_reason=result.get("reason", "revenue_maximization"),
-                explainability=result,
+            rows_written += len(chunk)
+            chunks += 1
+
+    return {
+        "rows_written": rows_written,
+        "chunks": chunks,
+        "elapsed_seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def _build_decision_rows_from_batches(batches, decision_date):
+    for batch in batches:
+        result = select_optimal_prices_batch(
+            prev_price=batch["prev_price"],
+            cost_price=batch["cost_price"],
+            base_demand=batch["predicted_units_sold"],
+            category=batch["category"],
+            inventory_lag_1=batch["inventory"],
+            sales_roll_mean_7=batch["sales_roll_mean_7"],
+            days_to_expiry=batch["clearance_days"],
+        )
+
+        prev_price = batch["prev_price"]
+        final_price = result["final_price"]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            price_change_pct = np.where(
+                prev_price > 0,
+                (final_price - prev_price) / prev_price * 100,
+                0,
             )
 
-            db.add(decision)
+        margin_ok = final_price >= batch["cost_price"] * (1 + batch["min_margin_pct"])
+
+        columns = zip(
+            batch["product_id"].tolist(),
+            prev_price.tolist(),
+            final_price.tolist(),
+            price_change_pct.tolist(),
+            batch["cost_price"].tolist(),
+            batch["min_margin_pct"].tolist(),
+            margin_ok.tolist(),
+            result["reason"].tolist(),
+            result["expected_units_sold"].tolist(),
+            result["expected_revenue"].tolist(),
+        )
+
+        for (
+            product_id, prev, final, change_pct, cost, min_margin,
+            ok, reason, units, revenue,
+        ) in columns:
+            # Same shape as select_optimal_price's result
+            if reason == "no_valid_candidate":
+                explainability = {"final_price": final, "reason": reason}
+            else:
+                explainability = {
+                    "final_price": final,
+                    "expected_units_sold": units,
+                    "expected_revenue": revenue,
+                    "reason": reason,
+                }
+
+            yield {
+                "decision_date": decision_date,
+                "product_id": product_id,
+                "strategy": ML_STRATEGY,
+                "prev_price": prev,
+                "final_price": final,
+                "price_change_pct": change_pct,
+                "cost_price": cost,
+                "min_margin_pct": min_margin,
+                "margin_ok": ok,
+                "decision_reason": reason,
+                "explainability": explainability,
+            }
+
+
+def run_ml_pricing_for_batches(batches, decision_date=None, chunk_size=None):
+    """
+    batches: iterable of column dicts from iter_pricing_input_batches
+
+    Prices each batch with the vectorized optimizer and streams the
+    decisions to the writer. Returns the write summary.
+    """
+
+    if decision_date is None:
+        decision_date = date.today()
 
-        db.commit()
+    rows = _build_decision_rows_from_batches(batches, decision_date)
 
-    finally:
-        db.close()
+    return write_pricing_decisions(rows, chunk_size=chunk_size)
@@ -0,0 +1,152 @@
+"""
+Sharded ML pricing execution.
+
+Splits the day's SKUs into contiguous product_id ranges of equal
+size and prices each range in its own worker process. Every worker
+streams its slice of feature_snapshots (a BETWEEN on the
+(snapshot_date, product_id) key), runs the batch optimizer and
+writes its own decisions; the parent then reconciles the decision
+log.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sqlalchemy import func, select
+
+from backend.common.database import engine
+from backend.common.models import PricingDecision
+from backend.pricing_inputs import (
+    iter_pricing_input_batches,
+    load_product_ids_for_date,
+)
+from backend.pricing_runner import (
+    ML_STRATEGY,
+    clear_decisions,
+    run_ml_pricing_for_batches,
+)
+
+
+def assign_shards(product_ids, n_shards):
+    """
+    (first, last) product_id of each of up to n_shards contiguous,
+    near-equal slices of product_ids.
+
+    product_ids must be in the database's product_id order (as
+    load_product_ids_for_date returns them), so a BETWEEN on each
+    range selects exactly its slice. The same SKUs always give the
+    same shards.
+    """
+    n_shards = min(n_shards, len(product_ids))
+    shards = []
+
+    for shard_id in range(n_shards):
+        lo = shard_id * len(product_ids) // n_shards
+        hi = (shard_id + 1) * len(product_ids) // n_shards
+        shards.append((product_ids[lo], product_ids[hi - 1]))
+
+    return shards
+
+
+def _init_worker():
+    # Forked workers must not reuse the parent's pooled connections
+    engine.dispose(close=False)
+
+
+def _price_shard(run_date, shard_id, product_range, chunk_size):
+    batches = iter_pricing_input_batches(run_date, product_range=product_range)
+
+    summary = run_ml_pricing_for_batches(
+        batches,
+        decision_date=run_date,
+        chunk_size=chunk_size,
+    )
+    summary["shard"] = shard_id
+
+    return summary
+
+
+def reconcile_decisions(run_date, product_ids):
+    """
+    Check every SKU got exactly one ML decision for run_date.
+    """
+
+    stmt = (
+        select(PricingDecision.product_id, func.count())
+        .where(
+            PricingDecision.decision_date == run_date,
+            PricingDecision.strategy == ML_STRATEGY,
+        )
+        .group_by(PricingDecision.product_id)
+    )
+
+    with engine.connect() as conn:
+        counts = dict(conn.execute(stmt).all())
+
+    expected = set(product_ids)
+
+    missing = sorted(expected - counts.keys())
+    unexpected = sorted(counts.keys() - expected)
+    duplicated = sorted(p for p, n in counts.items() if n > 1)
+
+    return {
+        "ok": not (missing or unexpected or duplicated),
+        "expected": len(expected),
+        "missing": missing,
+        "unexpected": unexpected,
+        "duplicated": duplicated,
+    }
+
+
+def run_sharded_ml_pricing(run_date, n_shards, max_workers=None, chunk_size=None):
+    """
+    Price run_date across n_shards worker processes.
+
+    Shards commit independently, so any ML decisions already logged
+    for run_date are cleared first: rerunning a failed or completed day
+    restores exactly one decision per SKU.
+
+    Returns a summary with per-shard write stats and the
+    reconciliation report. Raises RuntimeError if any SKU is
+    missing, duplicated or unexpected in the decision log.
+    """
+
+    start = time.perf_counter()
+
+    product_ids = load_product_ids_for_date(run_date)
+    shards = assign_shards(product_ids, n_shards)
+
+    cleared = clear_decisions(run_date)
+
+    if max_workers is None:
+        max_workers = min(n_shards, os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+    ) as pool:
+        futures = [
+            pool.submit(_price_shard, run_date, shard_id, product_range, chunk_size)
+            for shard_id, product_range in enumerate(shards)
+        ]
+        shard_summaries = [f.result() for f in futures]
+
+    reconciliation = reconcile_decisions(run_date, product_ids)
+
+    if not reconciliation["ok"]:
+        raise RuntimeError(
+            f"Pricing reconciliation failed for {run_date}: "
+            f"{len(reconciliation['missing'])} missing, "
+            f"{len(reconciliation['duplicated'])} duplicated, "
+            f"{len(reconciliation['unexpected'])} unexpected"
+        )
+
+    return {
+        "rows_written": sum(s["rows_written"] for s in shard_summaries),
+        "chunks": sum(s["chunks"] for s in shard_summaries),
+        "elapsed_seconds": round(time.perf_counter() - start, 3),
+        "cleared_rows": cleared,
+        "shards": shard_summaries,
+        "reconciliation": reconciliation,
+    }
@@ -0,0 +1,45 @@
+-- ==============================
+-- 001: Indexes for hot query paths
+-- ==============================
+-- Run outside a transaction (CREATE INDEX CONCURRENTLY), e.g.
+--   psql "$DATABASE_URL" -f db/migrations/001_query_indexes.sql
+
+CREATE TABLE IF NOT EXISTS feature_snapshots (
+    id SERIAL PRIMARY KEY,
+    snapshot_date DATE NOT NULL,
+    product_id TEXT NOT NULL,
+    prev_price DOUBLE PRECISION NOT NULL,
+    cost_price DOUBLE PRECISION NOT NULL,
+    min_margin_pct DOUBLE PRECISION NOT NULL,
+    predicted_demand DOUBLE PRECISION NOT NULL,
+    inventory INTEGER NOT NULL,
+    sales_roll_mean_7 DOUBLE PRECISION NOT NULL,
+    clearance_days INTEGER NOT NULL,
+    category TEXT NOT NULL
+);
+
+-- Keep the newest snapshot where a date was written twice
+DELETE FROM feature_snapshots a
+USING feature_snapshots b
+WHERE a.snapshot_date = b.snapshot_date
+  AND a.product_id = b.product_id
+  AND a.id < b.id;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_feature_snapshots_date_product
+    ON feature_snapshots (snapshot_date, product_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pricing_decisions_product_date
+    ON pricing_decisions (product_id, decision_date);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pricing_decisions_date_product
+    ON pricing_decisions (decision_date, product_id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_alerts_status_severity_first_seen
+    ON alerts (status, severity DESC, first_seen);
+
+-- Superseded by the index above (status alone never served the ORDER BY)
+DROP INDEX CONCURRENTLY IF EXISTS ix_alerts_status;
+
+ANALYZE feature_snapshots;
+ANALYZE pricing_decisions;
+ANALYZE alerts;
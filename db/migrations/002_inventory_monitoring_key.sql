@@ -0,0 +1,13 @@
+-- ==============================
+-- 002: One inventory outcome row per SKU per day
+-- ==============================
+-- Run outside a transaction (CREATE INDEX CONCURRENTLY).
+
+DELETE FROM inventory_monitoring a
+USING inventory_monitoring b
+WHERE a.date = b.date
+  AND a.product_id = b.product_id
+  AND a.id < b.id;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_inventory_monitoring_date_product
+    ON inventory_monitoring (date, product_id);
@@ -0,0 +1,15 @@
+-- ==============================
+-- 003: Daily PSI per monitored feature
+-- ==============================
+-- Run outside a transaction (CREATE INDEX CONCURRENTLY).
+
+ALTER TABLE feature_monitoring ADD COLUMN IF NOT EXISTS psi NUMERIC(10,4);
+
+DELETE FROM feature_monitoring a
+USING feature_monitoring b
+WHERE a.date = b.date
+  AND a.feature_name = b.feature_name
+  AND a.id < b.id;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_feature_monitoring_date_feature
+    ON feature_monitoring (date, feature_name);
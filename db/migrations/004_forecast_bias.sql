@@ -0,0 +1,27 @@
+-- ==============================
+-- 004: Forecast bias monitoring
+-- ==============================
+-- Run outside a transaction (CREATE INDEX CONCURRENTLY).
+
+DELETE FROM demand_monitoring a
+USING demand_monitoring b
+WHERE a.date = b.date
+  AND a.product_id = b.product_id
+  AND a.id < b.id;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_demand_monitoring_date_product
+    ON demand_monitoring (date, product_id);
+
+CREATE TABLE IF NOT EXISTS forecast_bias_state (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    as_of DATE NOT NULL,
+    predicted_sum_7d DOUBLE PRECISION NOT NULL,
+    actual_sum_7d DOUBLE PRECISION NOT NULL,
+    error_sum_7d DOUBLE PRECISION NOT NULL,
+    overforecast_count_7d INTEGER NOT NULL,
+    count_7d INTEGER NOT NULL,
+    over_bias_streak INTEGER NOT NULL,
+    under_bias_streak INTEGER NOT NULL,
+    PRIMARY KEY (scope, key)
+);
@@ -18,6 +18,27 @@ CREATE TABLE pricing_decisions (
     created_at TIMESTAMP DEFAULT NOW()
 );
 
+CREATE INDEX ix_pricing_decisions_product_date
+    ON pricing_decisions (product_id, decision_date);
+CREATE INDEX ix_pricing_decisions_date_product
+    ON pricing_decisions (decision_date, product_id);
+
+CREATE TABLE feature_snapshots (
+    id SERIAL PRIMARY KEY,
+    snapshot_date DATE NOT NULL,
+    product_id TEXT NOT NULL,
+    prev_price DOUBLE PRECISION NOT NULL,
+    cost_price DOUBLE PRECISION NOT NULL,
+    min_margin_pct DOUBLE PRECISION NOT NULL,
+    predicted_demand DOUBLE PRECISION NOT NULL,
+    inventory INTEGER NOT NULL,
+    sales_roll_mean_7 DOUBLE PRECISION NOT NULL,
+    clearance_days INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    CONSTRAINT uq_feature_snapshots_date_product
+        UNIQUE (snapshot_date, product_id)
+);
+
 CREATE TABLE demand_monitoring (
     id SERIAL PRIMARY KEY,
     date DATE NOT NULL,
@@ -26,7 +47,23 @@ CREATE TABLE demand_monitoring (
     actual_units_sold NUMERIC(10,2),
     prediction_error NUMERIC(10,2),
     overforecast_flag BOOLEAN,
-    created_at TIMESTAMP DEFAULT NOW()
+    created_at TIMESTAMP DEFAULT NOW(),
+    CONSTRAINT uq_demand_monitoring_date_product
+        UNIQUE (date, product_id)
+);
+
+CREATE TABLE forecast_bias_state (
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    as_of DATE NOT NULL,
+    predicted_sum_7d DOUBLE PRECISION NOT NULL,
+    actual_sum_7d DOUBLE PRECISION NOT NULL,
+    error_sum_7d DOUBLE PRECISION NOT NULL,
+    overforecast_count_7d INTEGER NOT NULL,
+    count_7d INTEGER NOT NULL,
+    over_bias_streak INTEGER NOT NULL,
+    under_bias_streak INTEGER NOT NULL,
+    PRIMARY KEY (scope, key)
 );
 
 CREATE TABLE inventory_monitoring (
@@ -38,7 +75,9 @@ CREATE TABLE inventory_monitoring (
     closing_inventory INTEGER,
     stockout_flag BOOLEAN,
     days_of_stock NUMERIC(8,2),
-    created_at TIMESTAMP DEFAULT NOW()
+    created_at TIMESTAMP DEFAULT NOW(),
+    CONSTRAINT uq_inventory_monitoring_date_product
+        UNIQUE (date, product_id)
 );
 
 CREATE TABLE feature_monitoring (
@@ -49,7 +88,10 @@ CREATE TABLE feature_monitoring (
     feature_std NUMERIC(10,4),
     feature_p50 NUMERIC(10,4),
     feature_p90 NUMERIC(10,4),
-    created_at TIMESTAMP DEFAULT NOW()
+    psi NUMERIC(10,4),
+    created_at TIMESTAMP DEFAULT NOW(),
+    CONSTRAINT uq_feature_monitoring_date_feature
+        UNIQUE (date, feature_name)
 );
 
 CREATE TABLE daily_kpis (
@@ -74,6 +116,9 @@ CREATE TABLE alerts (
     created_at TIMESTAMP DEFAULT NOW()
 );
 
+CREATE INDEX ix_alerts_status_severity_first_seen
+    ON alerts (status, severity DESC, first_seen);
+
 CREATE TABLE retraining_events (
     id SERIAL PRIMARY KEY,
     trigger_reason TEXT NOT NULL,